@@ -8,7 +8,6 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -29,10 +28,12 @@ from .coordinator import EnergyAdvisorCoordinator
 from .manager import (
     EnergyAdvisorRuntimeData,
     async_create_runtime_data,
+    async_remove_runtime_data,
     get_coordinator,
     set_coordinator,
 )
 from .models import ScheduleSolution
+from .price import price_fingerprint
 
 ConfigEntryType = ConfigEntry
 
@@ -52,17 +53,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntryType) -> bool
 
     hass.data[DOMAIN][entry.entry_id] = runtime
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except ConfigEntryNotReady:
-        raise
-    except Exception as exc:  # pragma: no cover - defensive guard
-        raise ConfigEntryNotReady(str(exc)) from exc
+    # Setup never waits for prices: entities start with the persisted plan (if
+    # any) and the first plan is computed once the price sensor reports prices.
+    coordinator.async_restore_plan()
+    coordinator.async_start()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     _async_register_services(hass)
 
+    if price_fingerprint(hass.states.get(runtime.config.price_sensor)) is not None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+
     return True
 
 
@@ -85,6 +89,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntryType) -> boo
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntryType) -> None:
+    """Delete the persisted data of a removed Energy Advisor config entry."""
+    await async_remove_runtime_data(hass, entry)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntryType) -> None:
     """Reload entry when config data changes."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -172,15 +181,7 @@ def _plan_to_dict(plan: ScheduleSolution) -> dict[str, Any]:
                 "start": activity.start.isoformat(),
                 "end": activity.end.isoformat(),
                 "cost": str(activity.cost),
-                "slots": [
-                    {
-                        "start": slot.start.isoformat(),
-                        "end": slot.end.isoformat(),
-                        "price": str(slot.price),
-                        "currency": slot.currency,
-                    }
-                    for slot in activity.slot_prices
-                ],
+                "slots": activity.slot_price_dicts(),
             }
             for activity in plan.activities
         ],
@@ -0,0 +1,117 @@
+"""Binary sensor platform for Energy Advisor."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from datetime import datetime
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_ACTIVITY_END, ATTR_ACTIVITY_ID, ATTR_ACTIVITY_START, DOMAIN
+from .coordinator import EnergyAdvisorCoordinator
+from .entity import EnergyAdvisorActivityEntity, async_track_activity_entities
+from .manager import EnergyAdvisorRuntimeData, get_coordinator
+from .models import ActivityDefinition
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities,
+) -> None:
+    """Set up Energy Advisor binary sensor entities."""
+    runtime: EnergyAdvisorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator: EnergyAdvisorCoordinator = get_coordinator(runtime)
+
+    def _running_sensor(activity: ActivityDefinition) -> EnergyAdvisorActivityRunningSensor:
+        return EnergyAdvisorActivityRunningSensor(coordinator, entry, activity)
+
+    async_track_activity_entities(
+        hass, entry, coordinator, async_add_entities, Platform.BINARY_SENSOR, _running_sensor
+    )
+
+
+class EnergyAdvisorActivityRunningSensor(EnergyAdvisorActivityEntity, BinarySensorEntity):
+    """Binary sensor that is on while an activity's planned slot is running.
+
+    The entity arms its own timer for the next start or end of the placement,
+    so it switches exactly on time without waiting for a coordinator update.
+    """
+
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _unique_id_suffix = "running"
+
+    def __init__(
+        self,
+        coordinator: EnergyAdvisorCoordinator,
+        entry: ConfigEntry,
+        activity: ActivityDefinition,
+    ) -> None:
+        super().__init__(coordinator, entry, activity)
+        self._transition_listener: CALLBACK_TYPE | None = None
+
+    @property
+    def is_on(self) -> bool:
+        placement = self.placement
+        if placement is None:
+            return False
+        return placement.start <= dt_util.utcnow() < placement.end
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        placement = self.placement
+        if placement is None:
+            return {ATTR_ACTIVITY_ID: self.activity_id}
+        return {
+            ATTR_ACTIVITY_ID: self.activity_id,
+            ATTR_ACTIVITY_START: placement.start.isoformat(),
+            ATTR_ACTIVITY_END: placement.end.isoformat(),
+        }
+
+    def _state_key(self) -> Hashable:
+        return (super()._state_key(), self.is_on)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._arm_transition()
+        self.async_on_remove(self._cancel_transition)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        super()._handle_coordinator_update()
+        self._arm_transition()
+
+    @callback
+    def _handle_transition(self, now: datetime) -> None:
+        self._transition_listener = None
+        super()._handle_coordinator_update()
+        self._arm_transition()
+
+    @callback
+    def _arm_transition(self) -> None:
+        """Schedule a state check at the next start or end of the placement."""
+        self._cancel_transition()
+        placement = self.placement
+        if placement is None:
+            return
+        now = dt_util.utcnow()
+        if now < placement.start:
+            when = placement.start
+        elif now < placement.end:
+            when = placement.end
+        else:
+            return
+        self._transition_listener = async_track_point_in_time(
+            self.hass, self._handle_transition, when
+        )
+
+    @callback
+    def _cancel_transition(self) -> None:
+        if self._transition_listener is not None:
+            self._transition_listener()
+            self._transition_listener = None
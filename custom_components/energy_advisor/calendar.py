@@ -0,0 +1,156 @@
+"""Calendar platform for Energy Advisor."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import EnergyAdvisorCoordinator
+from .entity import device_info
+from .manager import EnergyAdvisorRuntimeData, get_coordinator
+from .models import ScheduledActivity, ScheduleSolution
+
+ENTITY_ICON = "mdi:calendar-clock"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities,
+) -> None:
+    """Set up the Energy Advisor calendar entity."""
+    runtime: EnergyAdvisorRuntimeData = hass.data[DOMAIN][entry.entry_id]
+    coordinator: EnergyAdvisorCoordinator = get_coordinator(runtime)
+    async_add_entities([EnergyAdvisorCalendar(coordinator, entry)])
+
+
+class CalendarIndex:
+    """Start-sorted placements answering range queries by binary search.
+
+    ``max_duration`` bounds how far before a range an overlapping placement
+    can start, so a query only inspects placements starting in
+    ``[start - max_duration, end)``. Published plans are merged in place:
+    placements of the replaced plan that had not started yet are dropped and
+    those of the new plan are inserted.
+    """
+
+    def __init__(self) -> None:
+        self.placements: list[ScheduledActivity] = []
+        self.starts: list[datetime] = []
+        self.max_duration = timedelta(0)
+        self._keys: set[tuple[str, datetime]] = set()
+
+    def __len__(self) -> int:
+        return len(self.placements)
+
+    def publish(self, plan: ScheduleSolution) -> None:
+        """Merge ``plan``, which replaces every placement starting at or after its generation."""
+        self._delete(bisect_left(self.starts, plan.generated_at), len(self.placements))
+        for placement in plan.activities:
+            key = (placement.activity_id, placement.start)
+            if key in self._keys:
+                continue
+            index = bisect_right(self.starts, placement.start)
+            self.placements.insert(index, placement)
+            self.starts.insert(index, placement.start)
+            self._keys.add(key)
+            self.max_duration = max(self.max_duration, placement.end - placement.start)
+
+    def trim(self, cutoff: datetime) -> None:
+        """Drop placements that started before ``cutoff``."""
+        self._delete(0, bisect_left(self.starts, cutoff))
+
+    def between(self, start: datetime, end: datetime) -> list[ScheduledActivity]:
+        """Return placements overlapping ``[start, end)`` in start order."""
+        first = bisect_left(self.starts, start - self.max_duration)
+        last = bisect_left(self.starts, end)
+        return [item for item in self.placements[first:last] if item.end > start]
+
+    def current_or_next(self, now: datetime) -> ScheduledActivity | None:
+        """Return the placement running at ``now`` or else the next one to start."""
+        running = self.between(now, now + timedelta(microseconds=1))
+        if running:
+            return running[0]
+        index = bisect_right(self.starts, now)
+        return self.placements[index] if index < len(self.placements) else None
+
+    def _delete(self, first: int, last: int) -> None:
+        for placement in self.placements[first:last]:
+            self._keys.discard((placement.activity_id, placement.start))
+        del self.placements[first:last]
+        del self.starts[first:last]
+
+
+class EnergyAdvisorCalendar(CoordinatorEntity[EnergyAdvisorCoordinator], CalendarEntity):
+    """Calendar of planned activities, including those of replaced plans."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Schedule"
+    _attr_icon = ENTITY_ICON
+
+    def __init__(self, coordinator: EnergyAdvisorCoordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_calendar"
+        self._attr_device_info = device_info(entry)
+        self._index: CalendarIndex | None = None
+        self._indexed_plan: ScheduleSolution | None = None
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        placement = self._current_index().current_or_next(dt_util.utcnow())
+        return self._to_event(placement) if placement is not None else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        return [
+            self._to_event(placement)
+            for placement in self._current_index().between(start_date, end_date)
+        ]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._current_index()
+        super()._handle_coordinator_update()
+
+    def _current_index(self) -> CalendarIndex:
+        """Return the placement index, merging each published plan once.
+
+        The index is seeded from the plan history on first use, so past ranges
+        show what was recommended at the time, and trimmed to the history's
+        retention.
+        """
+        plan: ScheduleSolution | None = self.coordinator.data
+        index = self._index
+        if index is not None and plan is self._indexed_plan:
+            return index
+
+        history = self.coordinator.history
+        if index is None:
+            index = self._index = CalendarIndex()
+            if history is not None:
+                for past in history.iter_plans():
+                    index.publish(past)
+        if plan is not None:
+            index.publish(plan)
+        if history is not None:
+            index.trim(dt_util.utcnow() - history.max_age)
+        self._indexed_plan = plan
+        return index
+
+    def _to_event(self, placement: ScheduledActivity) -> CalendarEvent:
+        name = self.coordinator.get_activity_name(placement.activity_id)
+        return CalendarEvent(
+            start=placement.start,
+            end=placement.end,
+            summary=name or placement.activity_id,
+            description=f"Estimated cost: {placement.cost}",
+            uid=f"{placement.activity_id}-{int(placement.start.timestamp())}",
+        )
@@ -8,12 +8,26 @@ from typing import Any
 from homeassistant.config_entries import ConfigEntry
 
 from .const import (
+    CONF_INCREMENTAL_PLANNING,
+    CONF_MIN_LEAD_MINUTES,
+    CONF_PLANNER_BACKEND,
+    CONF_PLANNER_SOLVER,
+    CONF_PLANNING_TIMEOUT,
     CONF_PRICE_SENSOR,
+    CONF_ROLLING_HORIZON,
     CONF_SLOT_MINUTES,
+    CONF_SOLVER_TIME_BUDGET,
     CONF_TIMEZONE,
     CONF_WINDOW_END,
     CONF_WINDOW_START,
+    DEFAULT_INCREMENTAL_PLANNING,
+    DEFAULT_MIN_LEAD_MINUTES,
+    DEFAULT_PLANNER_BACKEND,
+    DEFAULT_PLANNER_SOLVER,
+    DEFAULT_PLANNING_TIMEOUT,
+    DEFAULT_ROLLING_HORIZON,
     DEFAULT_SLOT_MINUTES,
+    DEFAULT_SOLVER_TIME_BUDGET,
     DEFAULT_TIMEZONE,
     DEFAULT_WINDOW_END,
     DEFAULT_WINDOW_START,
@@ -31,6 +45,15 @@ def config_entry_to_model(entry: ConfigEntry) -> EnergyAdvisorConfig:
         window_start=_read_time(data, CONF_WINDOW_START, DEFAULT_WINDOW_START),
         window_end=_read_time(data, CONF_WINDOW_END, DEFAULT_WINDOW_END),
         timezone=data.get(CONF_TIMEZONE, DEFAULT_TIMEZONE),
+        planner_backend=data.get(CONF_PLANNER_BACKEND, DEFAULT_PLANNER_BACKEND),
+        planner_solver=data.get(CONF_PLANNER_SOLVER, DEFAULT_PLANNER_SOLVER),
+        solver_time_budget=float(data.get(CONF_SOLVER_TIME_BUDGET, DEFAULT_SOLVER_TIME_BUDGET)),
+        planning_timeout=float(data.get(CONF_PLANNING_TIMEOUT, DEFAULT_PLANNING_TIMEOUT)),
+        rolling_horizon=bool(data.get(CONF_ROLLING_HORIZON, DEFAULT_ROLLING_HORIZON)),
+        min_lead_minutes=int(data.get(CONF_MIN_LEAD_MINUTES, DEFAULT_MIN_LEAD_MINUTES)),
+        incremental_planning=bool(
+            data.get(CONF_INCREMENTAL_PLANNING, DEFAULT_INCREMENTAL_PLANNING)
+        ),
     )
 
 
@@ -52,6 +75,13 @@ def build_entry_data(config: EnergyAdvisorConfig) -> dict[str, Any]:
         CONF_SLOT_MINUTES: config.slot_minutes,
         CONF_WINDOW_START: time_to_str(config.window_start),
         CONF_WINDOW_END: time_to_str(config.window_end),
+        CONF_PLANNER_BACKEND: config.planner_backend,
+        CONF_PLANNER_SOLVER: config.planner_solver,
+        CONF_SOLVER_TIME_BUDGET: config.solver_time_budget,
+        CONF_PLANNING_TIMEOUT: config.planning_timeout,
+        CONF_ROLLING_HORIZON: config.rolling_horizon,
+        CONF_MIN_LEAD_MINUTES: config.min_lead_minutes,
+        CONF_INCREMENTAL_PLANNING: config.incremental_planning,
     }
     if config.timezone:
         payload[CONF_TIMEZONE] = config.timezone
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from dataclasses import replace
 from typing import Any
 from uuid import uuid4
 
@@ -14,8 +15,15 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .config import build_entry_data
 from .const import (
+    CONF_INCREMENTAL_PLANNING,
+    CONF_MIN_LEAD_MINUTES,
+    CONF_PLANNER_BACKEND,
+    CONF_PLANNER_SOLVER,
+    CONF_PLANNING_TIMEOUT,
     CONF_PRICE_SENSOR,
+    CONF_ROLLING_HORIZON,
     CONF_SLOT_MINUTES,
+    CONF_SOLVER_TIME_BUDGET,
     CONF_TIMEZONE,
     CONF_WINDOW_END,
     CONF_WINDOW_START,
@@ -25,6 +33,8 @@ from .const import (
     DEFAULT_WINDOW_START,
     DOMAIN,
     LOGGER,
+    PLANNER_BACKENDS,
+    PLANNER_SOLVERS,
 )
 from .manager import EnergyAdvisorRuntimeData, async_save_activities, get_coordinator
 from .models import ActivityDefinition, EnergyAdvisorConfig
@@ -167,18 +177,40 @@ class EnergyAdvisorOptionsFlowHandler(config_entries.OptionsFlow):
                 window_start = str_to_time(user_input[CONF_WINDOW_START])
                 window_end = str_to_time(user_input[CONF_WINDOW_END])
                 timezone = user_input.get(CONF_TIMEZONE) or None
+                planner_backend = user_input.get(CONF_PLANNER_BACKEND, config.planner_backend)
+                planner_solver = user_input.get(CONF_PLANNER_SOLVER, config.planner_solver)
+                solver_time_budget = float(
+                    user_input.get(CONF_SOLVER_TIME_BUDGET, config.solver_time_budget)
+                )
+                planning_timeout = float(
+                    user_input.get(CONF_PLANNING_TIMEOUT, config.planning_timeout)
+                )
+                rolling_horizon = bool(user_input.get(CONF_ROLLING_HORIZON, config.rolling_horizon))
+                min_lead_minutes = int(
+                    user_input.get(CONF_MIN_LEAD_MINUTES, config.min_lead_minutes)
+                )
+                incremental_planning = bool(
+                    user_input.get(CONF_INCREMENTAL_PLANNING, config.incremental_planning)
+                )
             except (KeyError, ValueError):
                 errors["base"] = ERROR_INVALID_TIME
             else:
                 if slot_minutes <= 0:
                     errors[CONF_SLOT_MINUTES] = ERROR_INVALID_SLOT
                 else:
-                    new_config = EnergyAdvisorConfig(
-                        price_sensor=config.price_sensor,
+                    new_config = replace(
+                        config,
                         slot_minutes=slot_minutes,
                         window_start=window_start,
                         window_end=window_end,
                         timezone=timezone,
+                        planner_backend=planner_backend,
+                        planner_solver=planner_solver,
+                        solver_time_budget=solver_time_budget,
+                        planning_timeout=planning_timeout,
+                        rolling_horizon=rolling_horizon,
+                        min_lead_minutes=min_lead_minutes,
+                        incremental_planning=incremental_planning,
                     )
                     self._runtime.config = new_config
                     self.hass.config_entries.async_update_entry(
@@ -195,6 +227,25 @@ class EnergyAdvisorOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(CONF_WINDOW_START, default=time_to_str(config.window_start)): str,
                 vol.Required(CONF_WINDOW_END, default=time_to_str(config.window_end)): str,
                 vol.Optional(CONF_TIMEZONE, default=config.timezone or self.hass.config.time_zone or ""): str,
+                vol.Optional(CONF_PLANNER_BACKEND, default=config.planner_backend): vol.In(
+                    PLANNER_BACKENDS
+                ),
+                vol.Optional(CONF_PLANNER_SOLVER, default=config.planner_solver): vol.In(
+                    PLANNER_SOLVERS
+                ),
+                vol.Optional(CONF_SOLVER_TIME_BUDGET, default=config.solver_time_budget): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1, max=60)
+                ),
+                vol.Optional(CONF_PLANNING_TIMEOUT, default=config.planning_timeout): vol.All(
+                    vol.Coerce(float), vol.Range(min=1, max=300)
+                ),
+                vol.Optional(CONF_ROLLING_HORIZON, default=config.rolling_horizon): bool,
+                vol.Optional(CONF_MIN_LEAD_MINUTES, default=config.min_lead_minutes): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=720)
+                ),
+                vol.Optional(
+                    CONF_INCREMENTAL_PLANNING, default=config.incremental_planning
+                ): bool,
             }
         )
         return self.async_show_form(step_id="global", data_schema=schema, errors=errors)
@@ -11,26 +11,57 @@ from homeassistant.const import Platform
 LOGGER = logging.getLogger(__package__)
 
 DOMAIN: Final = "energy_advisor"
-PLATFORMS: Final[list[Platform]] = [Platform.SENSOR]
+PLATFORMS: Final[list[Platform]] = [Platform.BINARY_SENSOR, Platform.CALENDAR, Platform.SENSOR]
 
 DATA_COORDINATOR: Final = "coordinator"
 DATA_MANAGER: Final = "manager"
+DATA_PRICE_CACHE: Final = f"{DOMAIN}_price_cache"
 
 CONF_PRICE_SENSOR: Final = "price_sensor"
 CONF_SLOT_MINUTES: Final = "slot_minutes"
 CONF_WINDOW_START: Final = "window_start"
 CONF_WINDOW_END: Final = "window_end"
 CONF_TIMEZONE: Final = "timezone"
+CONF_PLANNER_BACKEND: Final = "planner_backend"
+CONF_PLANNER_SOLVER: Final = "planner_solver"
+CONF_SOLVER_TIME_BUDGET: Final = "solver_time_budget"
+CONF_PLANNING_TIMEOUT: Final = "planning_timeout"
+CONF_ROLLING_HORIZON: Final = "rolling_horizon"
+CONF_MIN_LEAD_MINUTES: Final = "min_lead_minutes"
+CONF_INCREMENTAL_PLANNING: Final = "incremental_planning"
+
+PLANNER_BACKEND_PYTHON: Final = "python"
+PLANNER_BACKEND_NUMPY: Final = "numpy"
+PLANNER_BACKENDS: Final = [PLANNER_BACKEND_PYTHON, PLANNER_BACKEND_NUMPY]
+
+PLANNER_SOLVER_GREEDY: Final = "greedy"
+PLANNER_SOLVER_OPTIMAL: Final = "optimal"
+PLANNER_SOLVERS: Final = [PLANNER_SOLVER_GREEDY, PLANNER_SOLVER_OPTIMAL]
 
 DEFAULT_SLOT_MINUTES: Final = 60
 DEFAULT_WINDOW_START: Final = time(hour=0, minute=0)
 DEFAULT_WINDOW_END: Final = time(hour=23, minute=59)
 DEFAULT_TIMEZONE: Final | None = None
+DEFAULT_PLANNER_BACKEND: Final = PLANNER_BACKEND_PYTHON
+DEFAULT_PLANNER_SOLVER: Final = PLANNER_SOLVER_GREEDY
+DEFAULT_SOLVER_TIME_BUDGET: Final = 2.0
+DEFAULT_PLANNING_TIMEOUT: Final = 30.0
+DEFAULT_ROLLING_HORIZON: Final = False
+DEFAULT_MIN_LEAD_MINUTES: Final = 0
+DEFAULT_INCREMENTAL_PLANNING: Final = False
+
+# Local time at which day-ahead prices for tomorrow are usually published.
+PRICE_PUBLICATION_TIME: Final = time(hour=13, minute=0)
 
 SERVICE_RECOMPUTE: Final = "recompute_plan"
 SERVICE_EXPORT_PLAN: Final = "export_plan"
 
+EVENT_ACTIVITY_STARTED: Final = f"{DOMAIN}_activity_started"
+EVENT_ACTIVITY_ENDED: Final = f"{DOMAIN}_activity_ended"
+
 STORAGE_KEY_ACTIVITIES: Final = "activities"
+STORAGE_KEY_PLAN: Final = "plan"
+STORAGE_KEY_PRICES: Final = "prices"
 STORAGE_VERSION: Final = 1
 
 ATTR_PLAN_ACTIVITIES: Final = "activities"
@@ -40,5 +71,11 @@ ATTR_PLAN_AVERAGE_PRICE: Final = "average_price"
 ATTR_PLAN_HORIZON_START: Final = "horizon_start"
 ATTR_PLAN_HORIZON_END: Final = "horizon_end"
 ATTR_PLAN_UNSCHEDULED: Final = "unscheduled"
+ATTR_PLAN_SCHEDULED: Final = "scheduled"
 
 ATTR_ENTRY_ID: Final = "entry_id"
+ATTR_ACTIVITY_ID: Final = "activity_id"
+ATTR_ACTIVITY_NAME: Final = "name"
+ATTR_ACTIVITY_START: Final = "start"
+ATTR_ACTIVITY_END: Final = "end"
+ATTR_ACTIVITY_COST: Final = "cost"
@@ -2,20 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, tzinfo
+from datetime import time as dt_time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN, LOGGER, PRICE_PUBLICATION_TIME
+from .events import ActivityEventTimers
+from .history import PlanHistory
 from .manager import EnergyAdvisorRuntimeData
-from .models import ActivityDefinition
-from .planner import PlannerInputs, PlanningError, generate_plan
-from .price import PriceExtractionError, extract_price_points
+from .models import (
+    ActivityDefinition,
+    EnergyAdvisorConfig,
+    PriceSeries,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+from .planner import PlanMemo, PlannerInputs, PlanningCancelled, PlanningError
+from .price import (
+    PriceExtractionError,
+    get_price_cache,
+    price_fingerprint,
+    price_series_from_state,
+)
+from .scheduler import RefreshScheduler
 
-UPDATE_INTERVAL = timedelta(minutes=30)
+REFRESH_DEBOUNCE_SECONDS = 0.5
 
 
 class EnergyAdvisorCoordinator(DataUpdateCoordinator):
@@ -31,15 +53,47 @@ class EnergyAdvisorCoordinator(DataUpdateCoordinator):
             hass,
             LOGGER,
             name=f"{DOMAIN}-{entry.entry_id}",
-            update_interval=UPDATE_INTERVAL,
+            update_interval=None,
             config_entry=entry,
+            always_update=False,
         )
         self._runtime = runtime
         self._price_listener = None
+        self._boundary_listener = None
+        self._events_listener = None
+        self._started = False
+        self._activity_events = ActivityEventTimers(hass, entry.entry_id, self.get_activity_name)
+        self._price_series: PriceSeries | None = None
+        self._refresh_scheduler = RefreshScheduler(
+            hass, REFRESH_DEBOUNCE_SECONDS, self._async_run_refresh, self.name
+        )
+        self._run_generation = 0
+        self._cancel_event: threading.Event | None = None
+        self.last_plan_duration: float | None = None
+        self._price_fingerprint: int | None = None
+        self.refreshes_executed = 0
+        self.refreshes_skipped = 0
+        self._plan_memo = PlanMemo()
+        self._activity_names: dict[str, str] = {}
+        self._activity_names_source: list[ActivityDefinition] | None = None
+        self._placements: dict[str, ScheduledActivity] = {}
+        self._placements_plan: ScheduleSolution | None = None
+        self._plan_activities: list[ActivityDefinition] | None = None
+
+    def async_start(self) -> None:
+        """Subscribe to price sensor updates and arm the boundary and activity timers.
 
-    async def async_config_entry_first_refresh(self) -> None:
-        """Ensure we subscribe to sensor updates before the first refresh."""
-        await super().async_config_entry_first_refresh()
+        Timers are only armed once started, so a coordinator that is merely
+        refreshed leaves nothing scheduled behind.
+        """
+        self._started = True
+        self._subscribe_price_sensor()
+        if self._events_listener is None:
+            self._events_listener = self.async_add_listener(self._handle_plan_update)
+            self._handle_plan_update()
+        self._schedule_boundary_refresh()
+
+    def _subscribe_price_sensor(self) -> None:
         if self._price_listener is None:
             self._price_listener = async_track_state_change_event(
                 self.hass,
@@ -47,26 +101,174 @@ class EnergyAdvisorCoordinator(DataUpdateCoordinator):
                 self._handle_price_event,
             )
 
-    async def _async_update_data(self):  # type: ignore[override]
-        """Fetch the latest plan."""
+    @callback
+    def _handle_plan_update(self) -> None:
+        self._activity_events.async_update(self.data)
+
+    def async_restore_plan(self) -> bool:
+        """Publish the persisted plan if its horizon has not ended yet.
+
+        The restored plan keeps entities available until the price sensor
+        reports prices and a fresh plan replaces it.
+        """
+        stored = self._runtime.storage.state
+        plan = stored.plan
+        if plan is None or plan.horizon_end <= dt_util.utcnow():
+            return False
+        known = {activity.id for activity in self._runtime.activities}
+        if any(placement.activity_id not in known for placement in plan.activities):
+            return False
+        self._price_series = stored.prices
+        # _plan_activities stays unset, so the first computed plan replaces
+        # the restored one even when its schedule is the same.
+        self.async_set_updated_data(plan)
+        LOGGER.debug("%s: restored plan generated at %s", self.name, plan.generated_at)
+        return True
+
+    async def async_refresh(self) -> None:
+        """Request a refresh through the single-flight scheduler and wait for it."""
+        await self._refresh_scheduler.async_request()
+
+    async def async_request_refresh(self) -> None:
+        """Request a coalesced refresh; all triggers share the same scheduler."""
+        await self._refresh_scheduler.async_request()
+
+    async def async_request_plan(self) -> ScheduleSolution | None:
+        """Request a refresh and return the plan produced by the coalesced run."""
+        await self._refresh_scheduler.async_request()
+        return self.data
+
+    async def _async_run_refresh(self) -> None:
         try:
-            price_points = extract_price_points(self.hass, self._runtime.config.price_sensor)
-        except PriceExtractionError as exc:
-            raise UpdateFailed(str(exc)) from exc
+            await super().async_refresh()
+        finally:
+            self._schedule_boundary_refresh()
 
+    def _schedule_boundary_refresh(self) -> None:
+        """Arm a one-shot timer for the next boundary at which the plan can change."""
+        if self._boundary_listener is not None:
+            self._boundary_listener()
+            self._boundary_listener = None
+        if not self._started:
+            return
+        when = next_refresh_time(
+            dt_util.utcnow(), self._runtime.config, self._price_series, self.data
+        )
+        LOGGER.debug("%s: next boundary refresh at %s", self.name, when)
+        self._boundary_listener = async_track_point_in_time(
+            self.hass, self._handle_boundary, when
+        )
+
+    async def _handle_boundary(self, now: datetime) -> None:
+        self._boundary_listener = None
+        await self.async_refresh()
+
+    async def _async_update_data(self):  # type: ignore[override]
+        """Fetch the latest plan.
+
+        Price parsing and planning run in the executor so large horizons never
+        block the event loop. A newer run supersedes an in-flight one: the older
+        run is cancelled and its result discarded.
+        """
+        config = self._runtime.config
+        state = self.hass.states.get(config.price_sensor)
+        if state is None:
+            raise UpdateFailed(f"Sensor {config.price_sensor} is unavailable")
+
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        cancel_event = threading.Event()
+        self._cancel_event = cancel_event
+        self._run_generation += 1
+        generation = self._run_generation
+
+        fingerprint = price_fingerprint(state)
+        activities = list(self._runtime.activities)
+        price_cache = get_price_cache(self.hass)
+        cached_series = price_cache.get(state)
+        not_before: datetime | None = None
+        pinned: list[ScheduledActivity] = []
+        if config.rolling_horizon:
+            not_before = dt_util.utcnow() + timedelta(minutes=config.min_lead_minutes)
+            pinned = self._pinned_placements(not_before)
+        self.refreshes_executed += 1
+        started = time.monotonic()
         try:
-            plan = generate_plan(
-                PlannerInputs(
-                    config=self._runtime.config,
-                    activities=list(self._runtime.activities),
-                    prices=price_points,
+            async with asyncio.timeout(config.planning_timeout):
+                price_series, plan = await self.hass.async_add_executor_job(
+                    _compute_plan,
+                    state,
+                    cached_series,
+                    config,
+                    activities,
+                    cancel_event,
+                    self._plan_memo,
+                    not_before,
+                    pinned,
                 )
-            )
-        except PlanningError as exc:
+        except TimeoutError as exc:
+            cancel_event.set()
+            raise UpdateFailed(
+                f"Planning did not finish within {config.planning_timeout:.0f} seconds"
+            ) from exc
+        except PlanningCancelled:
+            LOGGER.debug("Discarding cancelled planning run %s", generation)
+            return self.data
+        except (PriceExtractionError, PlanningError) as exc:
             raise UpdateFailed(str(exc)) from exc
+        finally:
+            duration = time.monotonic() - started
+            if generation == self._run_generation:
+                self._cancel_event = None
+                self.last_plan_duration = duration
+            LOGGER.debug("Planning run %s took %.3f seconds", generation, duration)
+
+        if cached_series is None:
+            price_cache.put(state, price_series)
 
+        if generation != self._run_generation:
+            LOGGER.debug("Discarding stale result of planning run %s", generation)
+            return self.data
+
+        self._price_fingerprint = fingerprint
+        self._price_series = price_series
+        previous: ScheduleSolution | None = self.data
+        if (
+            previous is not None
+            and activities == self._plan_activities
+            and plan.same_schedule(previous)
+        ):
+            # Returning the published plan lets the coordinator skip notifying
+            # listeners, so entities, recorder and dashboards see no update.
+            # Edited activity definitions (e.g. a rename) always publish.
+            LOGGER.debug("Planning run %s produced an unchanged schedule", generation)
+            return previous
+        self._plan_activities = activities
+        self._runtime.storage.async_delay_save_plan(plan, price_series)
+        if self._runtime.history is not None:
+            self._runtime.history.async_append(plan)
         return plan
 
+    def _pinned_placements(self, not_before: datetime) -> list[ScheduledActivity]:
+        """Return placements of the current plan that can no longer be moved.
+
+        These are placements that start before ``not_before`` (already running,
+        or within the lead time) and ran or run today in the planning zone.
+        """
+        plan: ScheduleSolution | None = self.data
+        if plan is None:
+            return []
+        zone = _refresh_zone(self._runtime.config, self._price_series)
+        day_start = datetime.combine(dt_util.now(zone).date(), dt_time(0), tzinfo=zone)
+        known = {activity.id for activity in self._runtime.activities}
+        return [
+            placement
+            for placement in plan.activities
+            if placement.activity_id in known
+            and placement.start < not_before
+            and placement.end > day_start
+        ]
+
     async def async_update_activities(self, activities: list[ActivityDefinition]) -> None:
         """Replace tracked activities and refresh plan."""
         self._runtime.activities = activities
@@ -76,19 +278,171 @@ class EnergyAdvisorCoordinator(DataUpdateCoordinator):
             LOGGER.warning("Activity update failed to refresh plan: %s", exc)
 
     def get_activity_name(self, activity_id: str) -> str | None:
-        """Return the configured label for an activity."""
-        for activity in self._runtime.activities:
-            if activity.id == activity_id:
-                return activity.name
-        return None
-
-    async def _handle_price_event(self, event) -> None:
-        """Trigger refresh when price sensor updates."""
+        """Return the configured label for an activity.
+
+        The id-to-name index is rebuilt whenever the activity list is replaced.
+        """
+        activities = self._runtime.activities
+        if activities is not self._activity_names_source:
+            self._activity_names = {activity.id: activity.name for activity in activities}
+            self._activity_names_source = activities
+        return self._activity_names.get(activity_id)
+
+    @property
+    def activities(self) -> list[ActivityDefinition]:
+        """Return the tracked activity definitions."""
+        return self._runtime.activities
+
+    @property
+    def history(self) -> PlanHistory | None:
+        """Return the history of published plans."""
+        return self._runtime.history
+
+    def get_placement(self, activity_id: str) -> ScheduledActivity | None:
+        """Return the current plan's placement of an activity, if scheduled.
+
+        The id-to-placement index is rebuilt once per published plan.
+        """
+        plan: ScheduleSolution | None = self.data
+        if plan is None:
+            return None
+        if plan is not self._placements_plan:
+            self._placements = {placement.activity_id: placement for placement in plan.activities}
+            self._placements_plan = plan
+        return self._placements.get(activity_id)
+
+    @property
+    def refresh_stats(self) -> dict[str, int]:
+        """Return counters for executed and skipped planner refreshes."""
+        return {
+            "executed": self.refreshes_executed,
+            "skipped": self.refreshes_skipped,
+        }
+
+    @property
+    def plan_memo_stats(self) -> dict[str, int]:
+        """Return hit/miss counters of the planner memo."""
+        return self._plan_memo.stats
+
+    @property
+    def scheduler_stats(self) -> dict[str, int]:
+        """Return counters for refresh requests and the runs serving them."""
+        return self._refresh_scheduler.stats
+
+    @callback
+    def _handle_price_event(self, event) -> None:
+        """Trigger refresh when the raw price data of the sensor changes."""
+        fingerprint = price_fingerprint(event.data.get("new_state"))
+        if fingerprint is None:
+            LOGGER.debug(
+                "Price sensor %s has no price data; waiting for prices",
+                self._runtime.config.price_sensor,
+            )
+            return
+        if fingerprint == self._price_fingerprint and self.last_update_success:
+            self.refreshes_skipped += 1
+            LOGGER.debug(
+                "Price sensor %s changed without new price data; skipping refresh",
+                self._runtime.config.price_sensor,
+            )
+            return
         LOGGER.debug("Price sensor %s changed; triggering refresh", self._runtime.config.price_sensor)
-        await self.async_refresh()
+        self._refresh_scheduler.async_schedule()
 
     async def async_unload(self) -> None:
         """Clean up listeners."""
+        self._started = False
         if self._price_listener is not None:
             self._price_listener()
             self._price_listener = None
+        if self._boundary_listener is not None:
+            self._boundary_listener()
+            self._boundary_listener = None
+        if self._events_listener is not None:
+            self._events_listener()
+            self._events_listener = None
+        self._activity_events.async_cancel()
+        self._refresh_scheduler.async_cancel()
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+
+def _compute_plan(
+    state: State,
+    price_series: PriceSeries | None,
+    config: EnergyAdvisorConfig,
+    activities: list[ActivityDefinition],
+    cancel_event: threading.Event,
+    plan_memo: PlanMemo,
+    not_before: datetime | None = None,
+    pinned: list[ScheduledActivity] | None = None,
+) -> tuple[PriceSeries, ScheduleSolution]:
+    """Parse prices unless cached and generate a plan; runs in the executor.
+
+    With ``not_before`` the series is cut at the first slot boundary at or
+    after it, so elapsed slots are never planned.
+    """
+    if price_series is None:
+        price_series = price_series_from_state(state)
+    planning_series = price_series
+    if not_before is not None:
+        planning_series = price_series.since(int(not_before.timestamp()), config.slot_minutes)
+    plan = plan_memo.generate(
+        PlannerInputs(
+            config=config,
+            activities=activities,
+            prices=planning_series,
+            cancel_event=cancel_event,
+            pinned=pinned or [],
+        )
+    )
+    return price_series, plan
+
+
+def next_refresh_time(
+    now: datetime,
+    config: EnergyAdvisorConfig,
+    price_series: PriceSeries | None,
+    plan: ScheduleSolution | None,
+) -> datetime:
+    """Return the next instant after ``now`` at which the plan may change.
+
+    Candidates are the next slot boundary of the priced horizon (shifted by the
+    lead time in rolling-horizon mode, as that is when the cut moves), the next
+    planned activity start or end, the next local midnight and, while
+    tomorrow's prices are missing, the expected price publication time.
+    """
+    zone = _refresh_zone(config, price_series)
+    local_now = now.astimezone(zone)
+    midnight = datetime.combine(local_now.date() + timedelta(days=1), dt_time(0), tzinfo=zone)
+    candidates = [midnight]
+
+    if price_series is not None and len(price_series):
+        lead = config.min_lead_minutes * 60 if config.rolling_horizon else 0
+        step = max(config.slot_minutes, price_series.resolution_minutes) * 60
+        elapsed = int(now.timestamp()) + lead - price_series.start_ts
+        boundary_ts = price_series.start_ts + max(elapsed // step + 1, 0) * step
+        if boundary_ts < price_series.end.timestamp():
+            candidates.append(datetime.fromtimestamp(boundary_ts - lead, zone))
+        if price_series.end <= midnight:
+            candidates.append(
+                datetime.combine(local_now.date(), PRICE_PUBLICATION_TIME, tzinfo=zone)
+            )
+
+    if plan is not None:
+        for placement in plan.activities:
+            candidates.append(placement.start)
+            candidates.append(placement.end)
+
+    return min(candidate for candidate in candidates if candidate > now)
+
+
+def _refresh_zone(config: EnergyAdvisorConfig, price_series: PriceSeries | None) -> tzinfo:
+    if config.timezone:
+        zone = dt_util.get_time_zone(config.timezone)
+        if zone is not None:
+            return zone
+    if price_series is not None and price_series.tzinfo is not None:
+        return price_series.tzinfo
+    return dt_util.DEFAULT_TIME_ZONE
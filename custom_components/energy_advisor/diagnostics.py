@@ -0,0 +1,67 @@
+"""Diagnostics support for Energy Advisor."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .config import build_entry_data
+from .const import CONF_TIMEZONE, DOMAIN
+from .manager import EnergyAdvisorRuntimeData, get_coordinator
+from .models import ScheduleSolution, StoredActivity
+from .price import get_price_cache
+
+# The time zone hints at the user's location; activity metadata is free-form.
+TO_REDACT = {CONF_TIMEZONE, "metadata"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime: EnergyAdvisorRuntimeData | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if runtime is None:
+        return {}
+
+    payload: dict[str, Any] = {
+        "config": build_entry_data(runtime.config),
+        "activities": [
+            asdict(StoredActivity.from_definition(activity)) for activity in runtime.activities
+        ],
+    }
+
+    coordinator = get_coordinator(runtime)
+    if coordinator is not None:
+        payload["coordinator"] = {
+            "last_update_success": coordinator.last_update_success,
+            "last_plan_duration": coordinator.last_plan_duration,
+            "refresh_stats": coordinator.refresh_stats,
+            "scheduler_stats": coordinator.scheduler_stats,
+            "plan_memo_stats": coordinator.plan_memo_stats,
+        }
+        payload["plan"] = _plan_summary(coordinator.data)
+
+    if runtime.history is not None:
+        latest = runtime.history.latest_before(dt_util.utcnow())
+        payload["history"] = {"plans": len(runtime.history), "latest": _plan_summary(latest)}
+
+    payload["price_cache"] = get_price_cache(hass).stats
+    return async_redact_data(payload, TO_REDACT)
+
+
+def _plan_summary(plan: ScheduleSolution | None) -> dict[str, Any] | None:
+    if plan is None:
+        return None
+    return {
+        "generated_at": plan.generated_at.isoformat(),
+        "horizon_start": plan.horizon_start.isoformat(),
+        "horizon_end": plan.horizon_end.isoformat(),
+        "scheduled": len(plan.activities),
+        "unscheduled": list(plan.unscheduled_activity_ids),
+        "total_cost": str(plan.total_cost),
+    }
@@ -0,0 +1,124 @@
+"""Shared entity helpers for Energy Advisor platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import EnergyAdvisorCoordinator
+from .models import ActivityDefinition, ScheduledActivity
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device all Energy Advisor entities of an entry belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Energy Advisor",
+    )
+
+
+class EnergyAdvisorActivityEntity(CoordinatorEntity[EnergyAdvisorCoordinator]):
+    """Base for entities that follow the placement of a single activity.
+
+    Coordinator updates only lead to a state write when the entity's own
+    ``_state_key`` changed, so replanning one activity does not rewrite the
+    state of every other activity entity.
+    """
+
+    _attr_has_entity_name = True
+    _unique_id_suffix: str
+
+    def __init__(
+        self,
+        coordinator: EnergyAdvisorCoordinator,
+        entry: ConfigEntry,
+        activity: ActivityDefinition,
+    ) -> None:
+        super().__init__(coordinator)
+        self._activity_id = activity.id
+        self._attr_name = activity.name
+        self._attr_unique_id = f"{entry.entry_id}_{activity.id}_{self._unique_id_suffix}"
+        self._attr_device_info = device_info(entry)
+        self._last_state_key: Hashable = None
+
+    @property
+    def activity_id(self) -> str:
+        """Return the id of the followed activity."""
+        return self._activity_id
+
+    @property
+    def placement(self) -> ScheduledActivity | None:
+        """Return the current placement of the activity."""
+        return self.coordinator.get_placement(self._activity_id)
+
+    def _state_key(self) -> Hashable:
+        """Return the values the written state depends on."""
+        placement = self.placement
+        return (
+            self.coordinator.last_update_success,
+            self.coordinator.get_activity_name(self._activity_id),
+            None if placement is None else (placement.start, placement.end, placement.cost),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._last_state_key = self._state_key()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        key = self._state_key()
+        if key == self._last_state_key:
+            return
+        self._last_state_key = key
+        name = self.coordinator.get_activity_name(self._activity_id)
+        if name is not None:
+            self._attr_name = name
+        self.async_write_ha_state()
+
+
+@callback
+def async_track_activity_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: EnergyAdvisorCoordinator,
+    async_add_entities,
+    platform: str,
+    factory: Callable[[ActivityDefinition], EnergyAdvisorActivityEntity],
+) -> None:
+    """Add one entity per activity and keep the set in sync with the activities.
+
+    Entities of newly configured activities are added on the next coordinator
+    update; entities of removed activities are removed from the registry.
+    """
+    entities: dict[str, EnergyAdvisorActivityEntity] = {}
+
+    @callback
+    def _sync() -> None:
+        current = {activity.id: activity for activity in coordinator.activities}
+        added = [
+            factory(activity)
+            for activity_id, activity in current.items()
+            if activity_id not in entities
+        ]
+        for entity in added:
+            entities[entity.activity_id] = entity
+        if added:
+            async_add_entities(added)
+
+        registry = er.async_get(hass)
+        for activity_id in [key for key in entities if key not in current]:
+            entity = entities.pop(activity_id)
+            entity_id = registry.async_get_entity_id(platform, DOMAIN, entity.unique_id)
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+            elif entity.hass is not None:
+                hass.async_create_task(entity.async_remove())
+
+    _sync()
+    entry.async_on_unload(coordinator.async_add_listener(_sync))
@@ -0,0 +1,108 @@
+"""Activity start/end events for Energy Advisor."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_ACTIVITY_COST,
+    ATTR_ACTIVITY_END,
+    ATTR_ACTIVITY_ID,
+    ATTR_ACTIVITY_NAME,
+    ATTR_ACTIVITY_START,
+    ATTR_ENTRY_ID,
+    EVENT_ACTIVITY_ENDED,
+    EVENT_ACTIVITY_STARTED,
+)
+from .models import ScheduledActivity, ScheduleSolution
+
+
+@dataclass(slots=True)
+class _ArmedPlacement:
+    placement: ScheduledActivity
+    unsubs: list[CALLBACK_TYPE] = field(default_factory=list)
+
+    def cancel(self) -> None:
+        for unsub in self.unsubs:
+            unsub()
+        self.unsubs.clear()
+
+
+class ActivityEventTimers:
+    """Fire bus events exactly when planned activities start and end.
+
+    One point-in-time timer pair is kept per activity. On plan updates only
+    activities whose start or end moved are re-armed; the others keep their
+    timers.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        get_name: Callable[[str], str | None],
+    ) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._get_name = get_name
+        self._armed: dict[str, _ArmedPlacement] = {}
+
+    @callback
+    def async_update(self, plan: ScheduleSolution | None) -> None:
+        """Re-arm timers for placements that changed since the last update."""
+        placements = {} if plan is None else {item.activity_id: item for item in plan.activities}
+        for activity_id in [key for key in self._armed if key not in placements]:
+            self._armed.pop(activity_id).cancel()
+
+        now = dt_util.utcnow()
+        for activity_id, placement in placements.items():
+            armed = self._armed.get(activity_id)
+            if armed is not None:
+                previous = armed.placement
+                armed.placement = placement
+                if (previous.start, previous.end) == (placement.start, placement.end):
+                    continue
+                armed.cancel()
+            armed = _ArmedPlacement(placement)
+            for when, event_type in (
+                (placement.start, EVENT_ACTIVITY_STARTED),
+                (placement.end, EVENT_ACTIVITY_ENDED),
+            ):
+                if when > now:
+                    armed.unsubs.append(self._arm(when, event_type, activity_id))
+            self._armed[activity_id] = armed
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel all timers."""
+        for armed in self._armed.values():
+            armed.cancel()
+        self._armed.clear()
+
+    def _arm(self, when: datetime, event_type: str, activity_id: str) -> CALLBACK_TYPE:
+        @callback
+        def _fire(now: datetime) -> None:
+            armed = self._armed.get(activity_id)
+            if armed is None:
+                return
+            placement = armed.placement
+            self._hass.bus.async_fire(
+                event_type,
+                {
+                    ATTR_ENTRY_ID: self._entry_id,
+                    ATTR_ACTIVITY_ID: activity_id,
+                    ATTR_ACTIVITY_NAME: self._get_name(activity_id),
+                    ATTR_ACTIVITY_START: placement.start.isoformat(),
+                    ATTR_ACTIVITY_END: placement.end.isoformat(),
+                    ATTR_ACTIVITY_COST: str(placement.cost),
+                },
+            )
+
+        return async_track_point_in_time(self._hass, _fire, when)
+
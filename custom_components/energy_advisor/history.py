@@ -0,0 +1,270 @@
+"""Bounded history of recommended plans for Energy Advisor."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Any
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+from .models import ScheduledActivity, ScheduleSolution
+
+HISTORY_STORAGE_VERSION = 1
+HISTORY_MAX_PLANS = 1000
+HISTORY_MAX_AGE = timedelta(days=90)
+HISTORY_SAVE_DELAY_SECONDS = 300
+# Costs are kept as integers with this many decimals.
+HISTORY_COST_SCALE = 6
+
+# Row layout: generated, horizon start, horizon end, total cost, average price,
+# placements (flat [activity, start, end, cost] quadruples), unscheduled activities.
+# Times are epoch seconds, costs fixed-point and activities indexes into ``ids``.
+_Row = tuple[int, int, int, int, int, tuple[int, ...], tuple[int, ...]]
+
+
+class PlanHistory:
+    """Size- and age-bounded history of distinct plans.
+
+    Plans are kept as compact rows of integers ordered by generation time; the
+    oldest rows are dropped once ``max_plans`` or ``max_age`` is exceeded, and
+    activity ids no longer referenced by any row are dropped with them.
+    Reads decode only the rows inside the requested window. Writes go through
+    ``Store.async_delay_save`` so consecutive plans share one disk write.
+    """
+
+    def __init__(
+        self,
+        store: Store,
+        max_plans: int = HISTORY_MAX_PLANS,
+        max_age: timedelta = HISTORY_MAX_AGE,
+    ) -> None:
+        self._store = store
+        self._max_plans = max_plans
+        self._max_age = max_age
+        self._ids: list[str] = []
+        self._id_index: dict[str, int] = {}
+        # Number of row references per interned id.
+        self._id_refs: list[int] = []
+        self._rows: list[_Row] = []
+        self._generated: list[int] = []
+
+    @classmethod
+    def create(cls, hass, entry_id: str) -> "PlanHistory":
+        """Create a history bound to the config entry."""
+        store = Store(
+            hass, HISTORY_STORAGE_VERSION, f"{DOMAIN}_{entry_id}_history", private=True
+        )
+        return cls(store)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def max_age(self) -> timedelta:
+        """Return how long plans are retained."""
+        return self._max_age
+
+    async def async_load(self) -> None:
+        """Load persisted rows; unreadable data starts an empty history."""
+        data: dict[str, Any] | None = await self._store.async_load()
+        if not data:
+            return
+        try:
+            ids = [str(item) for item in data["ids"]]
+            rows = [_row_from_list(item) for item in data["plans"]]
+        except (KeyError, TypeError, ValueError) as exc:
+            LOGGER.warning("Discarding unreadable plan history: %s", exc)
+            return
+        valid = [row for row in rows if _row_ids_in_range(row, len(ids))]
+        if len(valid) < len(rows):
+            LOGGER.warning(
+                "Discarding %d plan history rows with unknown activities", len(rows) - len(valid)
+            )
+        self._ids = ids
+        self._id_index = {activity_id: index for index, activity_id in enumerate(ids)}
+        self._id_refs = [0] * len(ids)
+        self._rows = sorted(valid, key=lambda row: row[0])
+        self._generated = [row[0] for row in self._rows]
+        for row in self._rows:
+            self._count_refs(row, 1)
+        if 0 in self._id_refs:
+            self._compact_ids()
+
+    def async_append(self, plan: ScheduleSolution) -> bool:
+        """Append ``plan`` unless it repeats the latest schedule; return whether it was added."""
+        row = self._encode(plan)
+        if self._rows and self._rows[-1][2:] == row[2:]:
+            return False
+        if self._generated and row[0] < self._generated[-1]:
+            return False
+        self._rows.append(row)
+        self._generated.append(row[0])
+        self._count_refs(row, 1)
+        self._trim(row[0])
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY_SECONDS)
+        return True
+
+    async def async_remove(self) -> None:
+        """Drop all plans and delete the persisted history."""
+        self._ids = []
+        self._id_index = {}
+        self._id_refs = []
+        self._rows = []
+        self._generated = []
+        await self._store.async_remove()
+
+    def iter_plans(
+        self, start: datetime | None = None, end: datetime | None = None
+    ) -> Iterator[ScheduleSolution]:
+        """Yield plans generated in ``[start, end)``, oldest first, decoding lazily."""
+        first = 0 if start is None else bisect_left(self._generated, int(start.timestamp()))
+        last = (
+            len(self._rows) if end is None else bisect_left(self._generated, int(end.timestamp()))
+        )
+        for index in range(first, last):
+            yield self._decode(self._rows[index])
+
+    def latest_before(self, moment: datetime) -> ScheduleSolution | None:
+        """Return the newest plan generated before ``moment``.
+
+        The bound is exclusive, matching the inclusive start of ``iter_plans``,
+        so a plan generated exactly at ``moment`` is only yielded by the latter.
+        """
+        index = bisect_left(self._generated, int(moment.timestamp()))
+        return self._decode(self._rows[index - 1]) if index else None
+
+    def _trim(self, newest: int) -> None:
+        cutoff = newest - int(self._max_age.total_seconds())
+        drop = max(len(self._rows) - self._max_plans, bisect_left(self._generated, cutoff))
+        if drop > 0:
+            for row in self._rows[:drop]:
+                self._count_refs(row, -1)
+            del self._rows[:drop]
+            del self._generated[:drop]
+            if 0 in self._id_refs:
+                self._compact_ids()
+
+    def _count_refs(self, row: _Row, delta: int) -> None:
+        refs = self._id_refs
+        for index in row[5][::4]:
+            refs[index] += delta
+        for index in row[6]:
+            refs[index] += delta
+
+    def _compact_ids(self) -> None:
+        """Drop unreferenced ids and renumber the rows to the remaining ones."""
+        remap: dict[int, int] = {}
+        ids: list[str] = []
+        refs: list[int] = []
+        for index, count in enumerate(self._id_refs):
+            if count:
+                remap[index] = len(ids)
+                ids.append(self._ids[index])
+                refs.append(count)
+        self._rows = [
+            (
+                *row[:5],
+                tuple(
+                    remap[value] if position % 4 == 0 else value
+                    for position, value in enumerate(row[5])
+                ),
+                tuple(remap[index] for index in row[6]),
+            )
+            for row in self._rows
+        ]
+        self._ids = ids
+        self._id_index = {activity_id: index for index, activity_id in enumerate(ids)}
+        self._id_refs = refs
+
+    def _intern(self, activity_id: str) -> int:
+        index = self._id_index.get(activity_id)
+        if index is None:
+            index = len(self._ids)
+            self._ids.append(activity_id)
+            self._id_index[activity_id] = index
+            self._id_refs.append(0)
+        return index
+
+    def _encode(self, plan: ScheduleSolution) -> _Row:
+        placements: list[int] = []
+        for placement in plan.activities:
+            placements.extend(
+                (
+                    self._intern(placement.activity_id),
+                    int(placement.start.timestamp()),
+                    int(placement.end.timestamp()),
+                    _to_fixed(placement.cost),
+                )
+            )
+        return (
+            int(plan.generated_at.timestamp()),
+            int(plan.horizon_start.timestamp()),
+            int(plan.horizon_end.timestamp()),
+            _to_fixed(plan.total_cost),
+            _to_fixed(plan.average_price),
+            tuple(placements),
+            tuple(self._intern(activity_id) for activity_id in plan.unscheduled_activity_ids),
+        )
+
+    def _decode(self, row: _Row) -> ScheduleSolution:
+        generated, horizon_start, horizon_end, total_cost, average_price, flat, unscheduled = row
+        return ScheduleSolution(
+            generated_at=_from_epoch(generated),
+            horizon_start=_from_epoch(horizon_start),
+            horizon_end=_from_epoch(horizon_end),
+            activities=[
+                ScheduledActivity(
+                    activity_id=self._ids[flat[index]],
+                    start=_from_epoch(flat[index + 1]),
+                    end=_from_epoch(flat[index + 2]),
+                    slot_prices=[],
+                    cost=_from_fixed(flat[index + 3]),
+                )
+                for index in range(0, len(flat), 4)
+            ],
+            total_cost=_from_fixed(total_cost),
+            average_price=_from_fixed(average_price),
+            unscheduled_activity_ids=[self._ids[index] for index in unscheduled],
+        )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "ids": self._ids,
+            "plans": [[*row[:5], list(row[5]), list(row[6])] for row in self._rows],
+        }
+
+
+def _row_from_list(item: list[Any]) -> _Row:
+    generated, horizon_start, horizon_end, total_cost, average_price, flat, unscheduled = item
+    if len(flat) % 4:
+        raise ValueError("Placement data is not a multiple of four values")
+    return (
+        int(generated),
+        int(horizon_start),
+        int(horizon_end),
+        int(total_cost),
+        int(average_price),
+        tuple(int(value) for value in flat),
+        tuple(int(value) for value in unscheduled),
+    )
+
+
+def _row_ids_in_range(row: _Row, count: int) -> bool:
+    return all(0 <= index < count for index in (*row[5][::4], *row[6]))
+
+
+def _to_fixed(value: Decimal) -> int:
+    return int(value.scaleb(HISTORY_COST_SCALE).to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def _from_fixed(value: int) -> Decimal:
+    return Decimal(value).scaleb(-HISTORY_COST_SCALE)
+
+
+def _from_epoch(value: int) -> datetime:
+    return dt_util.as_local(datetime.fromtimestamp(value, timezone.utc))
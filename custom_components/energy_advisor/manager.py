@@ -11,6 +11,7 @@ from homeassistant.helpers.storage import Store
 
 from .config import config_entry_to_model
 from .const import DATA_COORDINATOR
+from .history import PlanHistory
 from .models import ActivityDefinition, EnergyAdvisorConfig
 from .storage import EnergyAdvisorStorage, EnergyAdvisorStorageState
 
@@ -23,6 +24,7 @@ class EnergyAdvisorRuntimeData:
     storage: EnergyAdvisorStorage
     activities: list[ActivityDefinition]
     extra: dict[str, Any]
+    history: PlanHistory | None = None
 
 
 async def async_create_runtime_data(hass: HomeAssistant, entry: ConfigEntry) -> EnergyAdvisorRuntimeData:
@@ -31,7 +33,17 @@ async def async_create_runtime_data(hass: HomeAssistant, entry: ConfigEntry) ->
     storage = EnergyAdvisorStorage.create(hass, entry.entry_id)
     state = await storage.async_load()
     activities = state.to_definitions()
-    return EnergyAdvisorRuntimeData(config=config, storage=storage, activities=activities, extra={})
+    history = PlanHistory.create(hass, entry.entry_id)
+    await history.async_load()
+    return EnergyAdvisorRuntimeData(
+        config=config, storage=storage, activities=activities, extra={}, history=history
+    )
+
+
+async def async_remove_runtime_data(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored activities, last plan and plan history of a removed entry."""
+    await EnergyAdvisorStorage.create(hass, entry.entry_id).async_remove()
+    await PlanHistory.create(hass, entry.entry_id).async_remove()
 
 
 async def async_save_activities(
@@ -41,6 +53,8 @@ async def async_save_activities(
     """Persist activities via storage helper and update runtime state."""
     runtime.activities = activities
     state = EnergyAdvisorStorageState.from_definitions(activities)
+    state.plan = runtime.storage.state.plan
+    state.prices = runtime.storage.state.prices
     await runtime.storage.async_save(state)
 
 
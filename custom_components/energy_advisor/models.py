@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, time
+from datetime import datetime, time, tzinfo
 from decimal import Decimal
-from typing import Any
+from typing import Any, overload
 
 
 @dataclass(slots=True)
@@ -17,6 +19,13 @@ class EnergyAdvisorConfig:
     window_start: time
     window_end: time
     timezone: str | None = None
+    planner_backend: str = "python"
+    planner_solver: str = "greedy"
+    solver_time_budget: float = 2.0
+    planning_timeout: float = 30.0
+    rolling_horizon: bool = False
+    min_lead_minutes: int = 0
+    incremental_planning: bool = False
 
 
 @dataclass(slots=True)
@@ -47,15 +56,295 @@ class PricePoint:
         return max(seconds // 60, 1)
 
 
+@dataclass(slots=True, eq=False)
+class PriceSeries(Sequence[PricePoint]):
+    """Contiguous price series on a fixed time grid, stored column-wise.
+
+    Prices are kept as fixed-point integers (``value / 10**scale``) in a shared
+    ``array('q')``, with the number of decimals each price was published with in
+    ``places`` so materialised ``PricePoint`` views reproduce the original
+    Decimal values exactly. A resampled series stores per-slot sums of
+    ``denominator`` raw prices. Slicing returns a view over the same buffers;
+    ``PricePoint`` objects are only built when items are accessed.
+    """
+
+    start_ts: int
+    resolution_minutes: int
+    values: array
+    places: array
+    scale: int
+    currency: str
+    tzinfo: tzinfo | None
+    denominator: int = 1
+    offset: int = 0
+    length: int = -1
+
+    def __post_init__(self) -> None:
+        if self.length < 0:
+            self.length = len(self.values) - self.offset
+
+    @classmethod
+    def from_points(cls, points: Iterable[PricePoint]) -> "PriceSeries":
+        """Build a series from price points.
+
+        Points are ordered by start; duplicate starts are dropped and the series
+        ends at the first gap or change of resolution.
+        """
+        ordered = sorted(points, key=lambda item: item.start)
+        if not ordered:
+            raise ValueError("Cannot build a price series without price points")
+
+        first = ordered[0]
+        resolution = first.duration_minutes()
+        step = resolution * 60
+        start_ts = int(first.start.timestamp())
+
+        kept: list[PricePoint] = []
+        expected = start_ts
+        for point in ordered:
+            timestamp = int(point.start.timestamp())
+            if timestamp < expected:
+                continue
+            if timestamp != expected or point.duration_minutes() != resolution:
+                break
+            if not point.price.is_finite():
+                raise ValueError(f"Invalid price value at {point.start.isoformat()}")
+            kept.append(point)
+            expected += step
+
+        exponents = [point.price.as_tuple().exponent for point in kept]
+        scale = max(0, *(-exponent for exponent in exponents))
+        try:
+            values = array("q", (int(point.price.scaleb(scale)) for point in kept))
+            places = array("b", (-exponent for exponent in exponents))
+        except OverflowError as exc:
+            raise ValueError("Price precision exceeds the supported range") from exc
+
+        return cls(
+            start_ts=start_ts,
+            resolution_minutes=resolution,
+            values=values,
+            places=places,
+            scale=scale,
+            currency=first.currency,
+            tzinfo=first.start.tzinfo,
+        )
+
+    @property
+    def start(self) -> datetime:
+        """Return the start of the first slot."""
+        return self.start_at(0)
+
+    @property
+    def end(self) -> datetime:
+        """Return the end of the last slot."""
+        return self.start_at(self.length)
+
+    def start_at(self, index: int) -> datetime:
+        """Return the start of slot ``index``; ``len(self)`` gives the series end."""
+        return datetime.fromtimestamp(
+            self.start_ts + index * self.resolution_minutes * 60, self.tzinfo
+        )
+
+    def price_at(self, index: int) -> Decimal:
+        """Return the Decimal price of slot ``index``."""
+        position = self.offset + index
+        places = self.places[position]
+        value = self.values[position]
+        if places < self.scale:
+            value //= 10 ** (self.scale - places)
+        price = Decimal(value).scaleb(-places)
+        if self.denominator != 1:
+            price = price / Decimal(self.denominator)
+        return price
+
+    def fixed_values(self) -> memoryview:
+        """Return the fixed-point values of this view without copying."""
+        return memoryview(self.values)[self.offset : self.offset + self.length]
+
+    def resample(self, resolution_minutes: int) -> "PriceSeries":
+        """Return the series aggregated to a coarser, whole-multiple resolution.
+
+        Slot prices become the average of the covered raw prices; a trailing
+        partial slot is dropped.
+        """
+        if resolution_minutes == self.resolution_minutes:
+            return self
+        if resolution_minutes <= 0 or resolution_minutes % self.resolution_minutes:
+            raise ValueError(
+                f"Resolution {resolution_minutes} is not a multiple of {self.resolution_minutes}"
+            )
+        ratio = resolution_minutes // self.resolution_minutes
+        values = array("q")
+        places = array("b")
+        try:
+            for first in range(self.offset, self.offset + self.length - ratio + 1, ratio):
+                values.append(sum(self.values[first : first + ratio]))
+                places.append(max(self.places[first : first + ratio]))
+        except OverflowError as exc:
+            raise ValueError("Price precision exceeds the supported range") from exc
+        return PriceSeries(
+            start_ts=self.start_ts,
+            resolution_minutes=resolution_minutes,
+            values=values,
+            places=places,
+            scale=self.scale,
+            currency=self.currency,
+            tzinfo=self.tzinfo,
+            denominator=self.denominator * ratio,
+        )
+
+    def since(self, timestamp: int, align_minutes: int | None = None) -> "PriceSeries":
+        """Return the view starting at the first slot that begins at or after ``timestamp``.
+
+        With ``align_minutes`` (a multiple of the resolution) the cut is rounded
+        up to a multiple of ``align_minutes`` from the series start, so later
+        resampling keeps the same slot boundaries. The index is computed from
+        the fixed grid, so no search over the slots is needed.
+        """
+        if timestamp <= self.start_ts:
+            return self
+        resolution = self.resolution_minutes * 60
+        step = resolution
+        if align_minutes and align_minutes % self.resolution_minutes == 0:
+            step = align_minutes * 60
+        index = -(-(timestamp - self.start_ts) // step) * step // resolution
+        return self[index:]
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """Return a compact, JSON-serialisable copy of the visible window.
+
+        The time zone is stored by IANA key, if it has one, and by its UTC
+        offset at the series start; ``from_snapshot`` takes the resolved zone
+        from the caller.
+        """
+        end = self.offset + self.length
+        offset = self.start.utcoffset() if self.tzinfo is not None else None
+        return {
+            "start": self.start_ts,
+            "resolution": self.resolution_minutes,
+            "scale": self.scale,
+            "denominator": self.denominator,
+            "currency": self.currency,
+            "timezone": getattr(self.tzinfo, "key", None),
+            "utc_offset": int(offset.total_seconds()) if offset is not None else None,
+            "values": self.values[self.offset : end].tolist(),
+            "places": self.places[self.offset : end].tolist(),
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict[str, Any], zone: tzinfo | None) -> "PriceSeries":
+        """Rebuild a series from ``to_snapshot`` output."""
+        values = array("q", data["values"])
+        places = array("b", data["places"])
+        if len(values) != len(places):
+            raise ValueError("Price snapshot values and places differ in length")
+        return cls(
+            start_ts=int(data["start"]),
+            resolution_minutes=int(data["resolution"]),
+            values=values,
+            places=places,
+            scale=int(data["scale"]),
+            currency=data["currency"],
+            tzinfo=zone,
+            denominator=int(data.get("denominator", 1)),
+        )
+
+    def cache_key(self) -> bytes:
+        """Return bytes identifying the visible contents of the series."""
+        header = (
+            f"{self.start_ts}|{self.resolution_minutes}|{self.scale}|"
+            f"{self.denominator}|{self.currency}|{self.tzinfo}|"
+        ).encode()
+        end = self.offset + self.length
+        return (
+            header
+            + memoryview(self.values)[self.offset : end].tobytes()
+            + memoryview(self.places)[self.offset : end].tobytes()
+        )
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> PricePoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PriceSeries": ...
+
+    def __getitem__(self, index: int | slice) -> "PricePoint | PriceSeries":
+        if isinstance(index, slice):
+            first, last, step = index.indices(self.length)
+            if step != 1:
+                raise ValueError("Price series slices must be contiguous")
+            last = max(first, last)
+            return PriceSeries(
+                start_ts=self.start_ts + first * self.resolution_minutes * 60,
+                resolution_minutes=self.resolution_minutes,
+                values=self.values,
+                places=self.places,
+                scale=self.scale,
+                currency=self.currency,
+                tzinfo=self.tzinfo,
+                denominator=self.denominator,
+                offset=self.offset + first,
+                length=last - first,
+            )
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Price series index out of range")
+        return PricePoint(
+            start=self.start_at(index),
+            end=self.start_at(index + 1),
+            price=self.price_at(index),
+            currency=self.currency,
+        )
+
+    def __iter__(self) -> Iterator[PricePoint]:
+        for index in range(self.length):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriceSeries):
+            return self.cache_key() == other.cache_key()
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 @dataclass(slots=True)
 class ScheduledActivity:
-    """Activity placement proposal."""
+    """Activity placement proposal.
+
+    ``slot_prices`` is normally a ``PriceSeries`` view into the planner's
+    series, so per-slot prices are only materialised when read.
+    """
 
     activity_id: str
     start: datetime
     end: datetime
-    slot_prices: list[PricePoint]
+    slot_prices: Sequence[PricePoint]
     cost: Decimal
+    _slot_price_dicts: list[dict[str, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def slot_price_dicts(self) -> list[dict[str, str]]:
+        """Return the slot prices serialised to strings, computed once per placement."""
+        if self._slot_price_dicts is None:
+            self._slot_price_dicts = [
+                {
+                    "start": point.start.isoformat(),
+                    "end": point.end.isoformat(),
+                    "price": str(point.price),
+                    "currency": point.currency,
+                }
+                for point in self.slot_prices
+            ]
+        return self._slot_price_dicts
 
 
 @dataclass(slots=True)
@@ -70,6 +359,30 @@ class ScheduleSolution:
     average_price: Decimal
     unscheduled_activity_ids: list[str] = field(default_factory=list)
 
+    def same_schedule(self, other: "ScheduleSolution") -> bool:
+        """Return whether ``other`` recommends the same schedule.
+
+        Compares placements, costs, the unscheduled set and the horizon end;
+        ``generated_at`` and ``horizon_start`` are ignored because they move
+        with every refresh without changing the recommendation.
+        """
+        if self is other:
+            return True
+        return (
+            self.horizon_end == other.horizon_end
+            and self.total_cost == other.total_cost
+            and self.average_price == other.average_price
+            and set(self.unscheduled_activity_ids) == set(other.unscheduled_activity_ids)
+            and len(self.activities) == len(other.activities)
+            and all(
+                mine.activity_id == theirs.activity_id
+                and mine.start == theirs.start
+                and mine.end == theirs.end
+                and mine.cost == theirs.cost
+                for mine, theirs in zip(self.activities, other.activities)
+            )
+        )
+
 
 @dataclass(slots=True)
 class StoredActivity:
@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import astuple, dataclass, field, replace
+from datetime import date, datetime, time, timedelta, tzinfo
 from decimal import Decimal
+import hashlib
 import math
-from typing import Iterable
+import threading
+import time as time_module
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
 
 from homeassistant.util import dt as dt_util
 
+from .const import (
+    LOGGER,
+    PLANNER_BACKEND_NUMPY,
+    PLANNER_BACKEND_PYTHON,
+    PLANNER_SOLVER_GREEDY,
+    PLANNER_SOLVER_OPTIMAL,
+)
 from .models import (
     ActivityDefinition,
     EnergyAdvisorConfig,
     PricePoint,
-    ScheduleSolution,
+    PriceSeries,
     ScheduledActivity,
+    ScheduleSolution,
 )
 
+COST_ENGINE_PREFIX_SUM = "prefix_sum"
+COST_ENGINE_SCAN = "scan"
+
 
 @dataclass(slots=True)
 class PlannerInputs:
@@ -25,65 +46,279 @@ class PlannerInputs:
 
     config: EnergyAdvisorConfig
     activities: list[ActivityDefinition]
-    prices: list[PricePoint]
+    prices: PriceSeries | list[PricePoint]
+    cost_engine: str = COST_ENGINE_PREFIX_SUM
+    cancel_event: threading.Event | None = None
+    pinned: list[ScheduledActivity] = field(default_factory=list)
 
 
 class PlanningError(Exception):
     """Raised when planning cannot be performed."""
 
 
+class PlanningCancelled(PlanningError):
+    """Raised when a planning run is cancelled before it completes."""
+
+
 def generate_plan(inputs: PlannerInputs) -> ScheduleSolution:
     """Produce a schedule based on the provided inputs."""
-    if not inputs.prices:
-        raise PlanningError("No price data available for planning")
+    return _plan_full(inputs).plan
+
+
+def planner_inputs_key(inputs: PlannerInputs) -> str:
+    """Return a stable digest of the configuration, cost engine, activities and prices."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(astuple(inputs.config)).encode())
+    digest.update(f"{inputs.cost_engine};".encode())
+    for activity in inputs.activities:
+        digest.update(repr(astuple(activity)).encode())
+    for placement in inputs.pinned:
+        digest.update(
+            f"{placement.activity_id}|{placement.start.isoformat()}|"
+            f"{placement.end.isoformat()}|{placement.cost};".encode()
+        )
+    digest.update(_price_series(inputs.prices).cache_key())
+    return digest.hexdigest()
+
+
+class PlanMemo:
+    """Return the previous plan while the planner inputs stay the same.
+
+    With ``incremental_planning`` enabled, a price series that only appends
+    slots to the previous one (e.g. tomorrow's prices arriving) is planned
+    incrementally from the remembered state, see ``_plan_extension``. Runs are
+    serialised because that state is updated in place.
+    """
+
+    def __init__(self) -> None:
+        self._key: str | None = None
+        self._state: _PlanState | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.extended = 0
 
-    slot_minutes = _infer_slot_minutes(inputs)
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of incremental runs."""
+        return {"hits": self.hits, "misses": self.misses, "extended": self.extended}
+
+    def generate(self, inputs: PlannerInputs) -> ScheduleSolution:
+        """Return the memoised plan for ``inputs`` or compute and remember a new one."""
+        key = planner_inputs_key(inputs)
+        with self._lock:
+            if self._state is not None and key == self._key:
+                self.hits += 1
+                return replace(self._state.plan, generated_at=dt_util.utcnow())
+
+            self.misses += 1
+            previous, self._state, self._key = self._state, None, None
+            state = None
+            if previous is not None and _can_extend(previous, inputs):
+                state = _plan_extension(previous, inputs)
+                if state is not None:
+                    self.extended += 1
+            if state is None:
+                state = _plan_full(inputs)
+            self._key = key
+            self._state = state
+            return state.plan
+
+    def clear(self) -> None:
+        """Forget the remembered plan."""
+        with self._lock:
+            self._key = None
+            self._state = None
+
+
+@dataclass(slots=True)
+class _PlanState:
+    """A finished planning run, kept so the next run can extend it."""
+
+    inputs: PlannerInputs
+    series: PriceSeries
+    grid: _SlotGrid
+    cost_index: _CostIndex | _NumpyCostIndex | None
+    starts: dict[str, int | None]
+    plan: ScheduleSolution
+
+
+def _plan_full(inputs: PlannerInputs) -> _PlanState:
+    series = _price_series(inputs.prices)
+
+    slot_minutes = _infer_slot_minutes(inputs.config, series)
     if slot_minutes <= 0:
         raise PlanningError("Invalid slot resolution")
 
-    sorted_prices = sorted(inputs.prices, key=lambda item: item.start)
-    prices = _aggregate_prices(sorted_prices, slot_minutes)
-    if not prices:
+    grid = _SlotGrid.build(series.resample(slot_minutes), _planning_zone(inputs.config, series))
+    if not grid.starts:
         raise PlanningError("Unable to aggregate price data for planning")
 
-    horizon_start = prices[0].start
-    horizon_end = prices[-1].end
+    cost_index = _build_cost_index(inputs, grid, slot_minutes)
+    activities = _ordered_activities(inputs)
+    reserved = _reserved_windows(grid, inputs.pinned)
 
-    slots = [
-        _PlannerSlot(index=i, price=price, slot_minutes=slot_minutes) for i, price in enumerate(prices)
-    ]
+    starts = _place_greedy(
+        activities, grid, inputs.config, slot_minutes, cost_index, inputs.cancel_event, reserved
+    )
+
+    solver = inputs.config.planner_solver
+    if solver == PLANNER_SOLVER_OPTIMAL:
+        starts = _place_optimal(
+            activities, grid, inputs.config, slot_minutes, starts, inputs.cancel_event, reserved
+        )
+    elif solver != PLANNER_SOLVER_GREEDY:
+        raise PlanningError(f"Unknown planner solver: {solver}")
+
+    starts_by_id = {activity.id: start for activity, start in zip(activities, starts)}
+    plan = _assemble_plan(inputs, grid, slot_minutes, activities, starts_by_id, {})
+    return _PlanState(inputs, series, grid, cost_index, starts_by_id, plan)
 
-    occupancy = [False] * len(slots)
-    scheduled: list[ScheduledActivity] = []
-    unscheduled: list[str] = []
 
-    activities = sorted(
-        inputs.activities,
+def _can_extend(previous: _PlanState, inputs: PlannerInputs) -> bool:
+    """Return whether ``inputs`` only add price slots to the previous run."""
+    config = inputs.config
+    if not config.incremental_planning or config.planner_solver != PLANNER_SOLVER_GREEDY:
+        return False
+    if inputs.pinned or previous.inputs.pinned:
+        return False
+    if (
+        config != previous.inputs.config
+        or inputs.cost_engine != previous.inputs.cost_engine
+        or inputs.activities != previous.inputs.activities
+        or len({activity.id for activity in inputs.activities}) != len(inputs.activities)
+    ):
+        return False
+    if not isinstance(inputs.prices, PriceSeries):
+        return False
+    return _extends(previous.series, inputs.prices)
+
+
+def _extends(old: PriceSeries, new: PriceSeries) -> bool:
+    """Return whether ``new`` holds every slot of ``old`` unchanged plus later slots."""
+    count = len(old)
+    return (
+        len(new) > count
+        and new.start_ts == old.start_ts
+        and new.resolution_minutes == old.resolution_minutes
+        and new.scale == old.scale
+        and new.denominator == old.denominator
+        and new.currency == old.currency
+        and new.tzinfo == old.tzinfo
+        and new.fixed_values()[:count] == old.fixed_values()
+        and memoryview(new.places)[new.offset : new.offset + count]
+        == memoryview(old.places)[old.offset : old.offset + count]
+    )
+
+
+def _plan_extension(previous: _PlanState, inputs: PlannerInputs) -> _PlanState | None:
+    """Plan the appended slots without redoing the whole horizon.
+
+    Placements stay where they are unless a free window overlapping the
+    appended slots is strictly cheaper; unscheduled activities take the
+    cheapest such window. Activities are visited in priority order and only
+    starts whose window reaches the appended slots are scanned, so the work
+    grows with the number of new slots rather than with the horizon. Unlike a
+    full replan, placements are never moved within the previously planned
+    slots.
+    """
+    config = inputs.config
+    slot_minutes = config.slot_minutes
+    series = inputs.prices
+    resampled = series.resample(slot_minutes)
+    grid = previous.grid
+    planned = len(grid)
+    if len(resampled) <= planned:
+        return None
+
+    grid.extend(resampled)
+    if isinstance(previous.cost_index, _CostIndex):
+        cost_index = previous.cost_index.extend(grid.series)
+    else:
+        cost_index = _build_cost_index(inputs, grid, slot_minutes)
+
+    activities = _ordered_activities(inputs)
+    occupancy = _OccupancyIndex(len(grid))
+    starts = dict(previous.starts)
+    kept = {placement.activity_id: placement for placement in previous.plan.activities}
+    for activity in activities:
+        start_index = starts[activity.id]
+        if start_index is not None:
+            required_minutes = _required_minutes(activity, slot_minutes)
+            occupancy.occupy(start_index, math.ceil(required_minutes / slot_minutes))
+
+    for activity in activities:
+        _raise_if_cancelled(inputs.cancel_event)
+        required_minutes = _required_minutes(activity, slot_minutes)
+        required_slots = math.ceil(required_minutes / slot_minutes)
+        current = starts[activity.id]
+        if current is not None:
+            occupancy.release(current, required_slots)
+        best_index = current
+        best_cost = kept[activity.id].cost if current is not None else None
+        first = max(planned - required_slots + 1, 0)
+        for feasible in grid.feasible_starts(activity, config, required_minutes):
+            if feasible.stop <= first:
+                continue
+            for index in occupancy.free_starts(
+                required_slots, max(feasible.start, first), feasible.stop
+            ):
+                candidate = grid.series[index : index + required_slots]
+                cost = _calculate_cost(candidate, required_minutes, slot_minutes)
+                if best_cost is None or cost < best_cost:
+                    best_index, best_cost = index, cost
+        starts[activity.id] = best_index
+        if best_index is not None:
+            occupancy.occupy(best_index, required_slots)
+        if best_index != current:
+            kept.pop(activity.id, None)
+
+    plan = _assemble_plan(inputs, grid, slot_minutes, activities, starts, kept)
+    return _PlanState(inputs, series, grid, cost_index, starts, plan)
+
+
+def _ordered_activities(inputs: PlannerInputs) -> list[ActivityDefinition]:
+    pinned_ids = {placement.activity_id for placement in inputs.pinned}
+    return sorted(
+        (activity for activity in inputs.activities if activity.id not in pinned_ids),
         key=lambda activity: (activity.priority, -activity.duration_minutes),
     )
 
+
+def _assemble_plan(
+    inputs: PlannerInputs,
+    grid: _SlotGrid,
+    slot_minutes: int,
+    activities: list[ActivityDefinition],
+    starts: dict[str, int | None],
+    kept: dict[str, ScheduledActivity],
+) -> ScheduleSolution:
+    """Build the published plan; placements in ``kept`` are reused as they are."""
+    scheduled: list[ScheduledActivity] = list(inputs.pinned)
+    unscheduled: list[str] = []
+    total_minutes = sum(
+        int((placement.end - placement.start).total_seconds()) // 60 for placement in inputs.pinned
+    )
     for activity in activities:
-        placement = _find_best_slot(activity, slots, occupancy, inputs.config, slot_minutes)
-        if placement is None:
+        start_index = starts[activity.id]
+        if start_index is None:
             unscheduled.append(activity.id)
             continue
-        scheduled_activity, occupied_indices = placement
-        scheduled.append(scheduled_activity)
-        for idx in occupied_indices:
-            occupancy[idx] = True
+        placement = kept.get(activity.id)
+        if placement is None:
+            placement = _build_placement(activity, grid, start_index, slot_minutes)
+        scheduled.append(placement)
+        total_minutes += _required_minutes(activity, slot_minutes)
 
     total_cost = sum((activity.cost for activity in scheduled), start=Decimal("0"))
     average_price = Decimal("0")
-    total_minutes = sum(
-        int((activity.end - activity.start).total_seconds() // 60) for activity in scheduled
-    )
     if total_minutes:
         average_price = total_cost / (Decimal(total_minutes) / Decimal(60))
 
     return ScheduleSolution(
         generated_at=dt_util.utcnow(),
-        horizon_start=horizon_start,
-        horizon_end=horizon_end,
+        horizon_start=grid.series.start,
+        horizon_end=grid.series.end,
         activities=scheduled,
         total_cost=total_cost,
         average_price=average_price,
@@ -92,32 +327,379 @@ def generate_plan(inputs: PlannerInputs) -> ScheduleSolution:
 
 
 @dataclass(slots=True)
-class _PlannerSlot:
-    """Internal representation of a planning slot."""
+class _SlotGrid:
+    """Planning slots in the local time of the planning zone.
+
+    Holds the resampled price series (rendered in ``zone``), the local start
+    time and epoch timestamp of each slot, and the feasible start ranges
+    computed so far for each activity window.
+    """
+
+    series: PriceSeries
+    zone: tzinfo
+    starts: list[datetime]
+    timestamps: list[int]
+    _feasible: dict[tuple[time, time, int], list[range]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, series: PriceSeries, zone: tzinfo) -> "_SlotGrid":
+        series = replace(series, tzinfo=zone)
+        step = series.resolution_minutes * 60
+        timestamps = [series.start_ts + index * step for index in range(len(series))]
+        starts = [datetime.fromtimestamp(timestamp, zone) for timestamp in timestamps]
+        return cls(series=series, zone=zone, starts=starts, timestamps=timestamps)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def extend(self, series: PriceSeries) -> None:
+        """Grow the grid to ``series``, whose leading slots match the current ones."""
+        series = replace(series, tzinfo=self.zone)
+        step = series.resolution_minutes * 60
+        for index in range(len(self.timestamps), len(series)):
+            timestamp = series.start_ts + index * step
+            self.timestamps.append(timestamp)
+            self.starts.append(datetime.fromtimestamp(timestamp, self.zone))
+        self.series = series
+        self._feasible.clear()
+
+    def local_time(self, timestamp: int) -> datetime:
+        """Return ``timestamp`` as an aware datetime in the planning zone."""
+        return datetime.fromtimestamp(timestamp, self.zone)
+
+    def feasible_starts(
+        self,
+        activity: ActivityDefinition,
+        config: EnergyAdvisorConfig,
+        required_minutes: int,
+    ) -> list[range]:
+        """Return the index ranges of starts whose run fits the activity's daily window.
+
+        A window opens at ``earliest`` local time each day and closes at
+        ``latest`` the same day, or the next day when ``latest`` is not after
+        ``earliest`` (e.g. 22:00-06:00). Window bounds are converted to epoch
+        seconds per local date, so DST changes only move the bounds, and the
+        starts inside each window are found with bisect. Ranges are cached per
+        distinct ``(earliest, latest, duration)`` and shared between activities.
+        """
+        earliest = activity.earliest_start or config.window_start
+        latest = activity.latest_end or config.window_end
+        key = (earliest, latest, required_minutes)
+        ranges = self._feasible.get(key)
+        if ranges is not None:
+            return ranges
+
+        ranges = []
+        if self.starts:
+            duration = required_minutes * 60
+            closes_next_day = latest <= earliest
+            day = self.starts[0].date() - timedelta(days=1)
+            last_day = self.starts[-1].date()
+            covered = 0
+            while day <= last_day:
+                opens = self._local_timestamp(day, earliest)
+                closes = self._local_timestamp(
+                    day + timedelta(days=1) if closes_next_day else day, latest
+                )
+                low = max(bisect_left(self.timestamps, opens), covered)
+                high = bisect_right(self.timestamps, closes - duration)
+                if low < high:
+                    ranges.append(range(low, high))
+                    covered = high
+                day += timedelta(days=1)
+        self._feasible[key] = ranges
+        return ranges
+
+    def _local_timestamp(self, day: date, tme: time) -> int:
+        return int(datetime.combine(day, tme, tzinfo=self.zone).timestamp())
+
+    def candidate_starts(
+        self,
+        activity: ActivityDefinition,
+        config: EnergyAdvisorConfig,
+        occupancy: "_OccupancyIndex",
+        required_minutes: int,
+        required_slots: int,
+    ) -> Iterator[int]:
+        """Yield, in order, every feasible start whose window is still free."""
+        for feasible in self.feasible_starts(activity, config, required_minutes):
+            yield from occupancy.free_starts(required_slots, feasible.start, feasible.stop)
+
+
+class _OccupancyIndex:
+    """Free and occupied run lengths over the slot grid.
+
+    ``runs[i]`` is the number of consecutive free slots starting at ``i`` or,
+    when slot ``i`` is taken, minus the number of consecutive taken slots. A
+    window of ``k`` slots starting at ``i`` is free exactly when
+    ``runs[i] >= k``, and searches jump over a whole run at a time. Placing or
+    removing a window only rewrites the window and the run just before it.
+    """
+
+    __slots__ = ("runs",)
+
+    def __init__(self, size: int) -> None:
+        self.runs = array("q", range(size, 0, -1))
+
+    @classmethod
+    def with_reserved(cls, size: int, windows: list[tuple[int, int]] | None) -> "_OccupancyIndex":
+        """Return an index with the given ``(start, length)`` windows already taken."""
+        occupancy = cls(size)
+        for first, length in windows or ():
+            for index in range(first, first + length):
+                if occupancy.is_free(index, 1):
+                    occupancy.occupy(index, 1)
+        return occupancy
+
+    def is_free(self, start: int, length: int) -> bool:
+        """Return whether ``length`` slots starting at ``start`` are all free."""
+        return self.runs[start] >= length
+
+    def free_starts(self, length: int, first: int = 0, stop: int | None = None) -> Iterator[int]:
+        """Yield, in order, the starts in ``[first, stop)`` of free ``length``-slot windows."""
+        runs = self.runs
+        last = len(runs) - length
+        if stop is not None:
+            last = min(last, stop - 1)
+        index = first
+        while index <= last:
+            run = runs[index]
+            if run >= length:
+                yield from range(index, min(index + run - length, last) + 1)
+                index += run
+            elif run > 0:
+                index += run
+            else:
+                index -= run
+
+    def occupy(self, start: int, length: int) -> None:
+        """Mark a free window as taken."""
+        runs = self.runs
+        end = start + length
+        tail = -runs[end] if end < len(runs) and runs[end] < 0 else 0
+        for index in range(end - 1, start - 1, -1):
+            tail += 1
+            runs[index] = -tail
+        self._update_before(start, taken=True)
+
+    def release(self, start: int, length: int) -> None:
+        """Mark a previously occupied window as free again."""
+        runs = self.runs
+        end = start + length
+        tail = runs[end] if end < len(runs) and runs[end] > 0 else 0
+        for index in range(end - 1, start - 1, -1):
+            tail += 1
+            runs[index] = tail
+        self._update_before(start, taken=False)
+
+    def _update_before(self, start: int, taken: bool) -> None:
+        """Rewrite the run that ends right before ``start``."""
+        runs = self.runs
+        index = start - 1
+        if index < 0:
+            return
+        if (runs[index] < 0) == taken:
+            # Same state as the changed window: the runs merge.
+            step = -1 if taken else 1
+            while index >= 0 and (runs[index] < 0) == taken:
+                runs[index] = runs[index + 1] + step
+                index -= 1
+        else:
+            # Opposite state: the run is now cut off at ``start``.
+            step = 1 if taken else -1
+            distance = 0
+            while index >= 0 and (runs[index] < 0) != taken:
+                distance += step
+                runs[index] = distance
+                index -= 1
 
-    index: int
-    price: PricePoint
+
+@dataclass(slots=True)
+class _CostIndex:
+    """Prefix sums over fixed-point slot values for constant-time window costing.
+
+    Window scores are integers equal to ``cost * 60 * 10**places * ratio``, where
+    ``places`` is the scale of the price series and ``ratio`` is the number of
+    raw points per slot. Scores are exact and are only
+    used to rank candidates; the Decimal amounts published on the
+    ``ScheduleSolution`` are derived once per placement by ``_calculate_cost``,
+    which keeps the original ``price * (minutes / 60)`` rounding so outputs are
+    unchanged.
+    """
+
+    prefix: list[int]
+    values: list[int]
     slot_minutes: int
 
-    @property
-    def start(self) -> datetime:
-        return self.price.start
+    @classmethod
+    def build(cls, series: PriceSeries, slot_minutes: int) -> "_CostIndex":
+        values = series.fixed_values().tolist()
+        prefix = [0]
+        running = 0
+        for value in values:
+            running += value
+            prefix.append(running)
+        return cls(prefix=prefix, values=values, slot_minutes=slot_minutes)
+
+    def extend(self, series: PriceSeries) -> "_CostIndex":
+        """Append the slots of ``series`` beyond the ones already indexed."""
+        running = self.prefix[-1]
+        for value in series.fixed_values()[len(self.values) :].tolist():
+            running += value
+            self.values.append(value)
+            self.prefix.append(running)
+        return self
+
+    def window_score(self, start: int, required_slots: int, last_portion: int) -> int:
+        """Return the fixed-point score of a window starting at ``start``."""
+        last = start + required_slots - 1
+        full = self.prefix[last] - self.prefix[start]
+        return full * self.slot_minutes + self.values[last] * last_portion
+
+    def best_start(
+        self,
+        activity: ActivityDefinition,
+        grid: _SlotGrid,
+        occupancy: _OccupancyIndex,
+        config: EnergyAdvisorConfig,
+        required_minutes: int,
+        required_slots: int,
+    ) -> int | None:
+        """Search free candidate windows in O(1) each using prefix sums."""
+        last_portion = required_minutes - (required_slots - 1) * self.slot_minutes
+
+        best_score: int | None = None
+        best_index: int | None = None
+
+        for index in grid.candidate_starts(
+            activity, config, occupancy, required_minutes, required_slots
+        ):
+            score = self.window_score(index, required_slots, last_portion)
+            if best_score is None or score < best_score:
+                best_score = score
+                best_index = index
+
+        return best_index
+
+
+# Scores must stay well inside int64 for the vectorised backend.
+_NUMPY_SCORE_LIMIT = 2**62
 
-    @property
-    def end(self) -> datetime:
-        return self.price.end
 
-    @property
-    def price_value(self) -> Decimal:
-        return self.price.price
+@dataclass(slots=True)
+class _NumpyCostIndex:
+    """Vectorised variant of ``_CostIndex`` backed by NumPy arrays.
+
+    All candidate windows of an activity are scored at once from the cumulative
+    sum, the precomputed feasible ranges and the occupancy runs are applied as
+    boolean masks and the first minimum is picked with ``argmin``, matching the
+    pure-Python tie-break.
+    """
+
+    prefix: "np.ndarray"
+    values: "np.ndarray"
+    slot_minutes: int
+
+    @classmethod
+    def build(cls, grid: _SlotGrid, slot_minutes: int) -> "_NumpyCostIndex | None":
+        """Return an index, or None when NumPy is unusable for these values."""
+        if np is None:
+            return None
+        raw = grid.series.fixed_values()
+        bound = sum(abs(value) for value in raw) * slot_minutes * 2
+        if bound >= _NUMPY_SCORE_LIMIT:
+            return None
+        values = np.frombuffer(raw, dtype=np.int64)
+        prefix = np.zeros(len(grid) + 1, dtype=np.int64)
+        np.cumsum(values, out=prefix[1:])
+        return cls(prefix=prefix, values=values, slot_minutes=slot_minutes)
+
+    def best_start(
+        self,
+        activity: ActivityDefinition,
+        grid: _SlotGrid,
+        occupancy: _OccupancyIndex,
+        config: EnergyAdvisorConfig,
+        required_minutes: int,
+        required_slots: int,
+    ) -> int | None:
+        """Score every candidate window in one pass and return the cheapest start."""
+        candidates = len(grid) - required_slots + 1
+        if candidates <= 0:
+            return None
+        last_portion = required_minutes - (required_slots - 1) * self.slot_minutes
+        last = required_slots - 1
+
+        mask = np.zeros(candidates, dtype=bool)
+        for feasible in grid.feasible_starts(activity, config, required_minutes):
+            mask[feasible.start : feasible.stop] = True
+        runs = np.frombuffer(occupancy.runs, dtype=np.int64)
+        mask &= runs[:candidates] >= required_slots
+
+        feasible = np.flatnonzero(mask)
+        if feasible.size == 0:
+            return None
+
+        full = self.prefix[feasible + last] - self.prefix[feasible]
+        scores = full * self.slot_minutes + self.values[feasible + last] * last_portion
+        return int(feasible[int(np.argmin(scores))])
+
+
+def _build_cost_index(
+    inputs: PlannerInputs,
+    grid: _SlotGrid,
+    slot_minutes: int,
+) -> _CostIndex | _NumpyCostIndex | None:
+    if inputs.cost_engine == COST_ENGINE_SCAN:
+        return None
+    if inputs.cost_engine != COST_ENGINE_PREFIX_SUM:
+        raise PlanningError(f"Unknown cost engine: {inputs.cost_engine}")
+
+    backend = inputs.config.planner_backend
+    if backend == PLANNER_BACKEND_NUMPY:
+        numpy_index = _NumpyCostIndex.build(grid, slot_minutes)
+        if numpy_index is not None:
+            return numpy_index
+        LOGGER.debug("NumPy planner backend unavailable; using pure-Python backend")
+    elif backend != PLANNER_BACKEND_PYTHON:
+        raise PlanningError(f"Unknown planner backend: {backend}")
+    return _CostIndex.build(grid.series, slot_minutes)
+
+
+def _price_series(prices: PriceSeries | list[PricePoint]) -> PriceSeries:
+    if isinstance(prices, PriceSeries):
+        series = prices
+    else:
+        if not prices:
+            raise PlanningError("No price data available for planning")
+        try:
+            series = PriceSeries.from_points(prices)
+        except ValueError as exc:
+            raise PlanningError(str(exc)) from exc
+    if not series:
+        raise PlanningError("No price data available for planning")
+    return series
+
+
+def _planning_zone(config: EnergyAdvisorConfig, series: PriceSeries) -> tzinfo:
+    """Return the zone activity windows refer to.
+
+    Uses the configured time zone, falling back to the zone of the price data.
+    """
+    if config.timezone:
+        zone = dt_util.get_time_zone(config.timezone)
+        if zone is not None:
+            return zone
+        LOGGER.debug("Unknown time zone %s; using the price data time zone", config.timezone)
+    return series.tzinfo or dt_util.DEFAULT_TIME_ZONE
 
 
-def _infer_slot_minutes(inputs: PlannerInputs) -> int:
-    configured = inputs.config.slot_minutes
+def _infer_slot_minutes(config: EnergyAdvisorConfig, series: PriceSeries) -> int:
+    configured = config.slot_minutes
     if configured <= 0:
         raise PlanningError("Configured slot minutes must be positive")
 
-    raw_minutes = inputs.prices[0].duration_minutes()
+    raw_minutes = series.resolution_minutes
     if raw_minutes <= 0:
         raise PlanningError("Invalid raw price slot duration")
 
@@ -128,106 +710,241 @@ def _infer_slot_minutes(inputs: PlannerInputs) -> int:
     return configured
 
 
-def _aggregate_prices(prices: list[PricePoint], slot_minutes: int) -> list[PricePoint]:
-    """Aggregate raw price data to the configured slot duration."""
-    raw_minutes = prices[0].duration_minutes()
-    if slot_minutes == raw_minutes:
-        return prices
+def _required_minutes(activity: ActivityDefinition, slot_minutes: int) -> int:
+    return max(activity.duration_minutes, slot_minutes)
 
-    ratio = slot_minutes // raw_minutes
-    if ratio <= 0:
-        return []
 
-    aggregated: list[PricePoint] = []
-    for i in range(0, len(prices), ratio):
-        chunk = prices[i : i + ratio]
-        if len(chunk) < ratio:
-            break
-        start = chunk[0].start
-        end = chunk[-1].end
-        total = sum((point.price for point in chunk), start=Decimal("0"))
-        average = total / Decimal(len(chunk))
-        aggregated.append(PricePoint(start=start, end=end, price=average, currency=chunk[0].currency))
-    return aggregated
+def _place_greedy(
+    activities: list[ActivityDefinition],
+    grid: _SlotGrid,
+    config: EnergyAdvisorConfig,
+    slot_minutes: int,
+    cost_index: _CostIndex | _NumpyCostIndex | None,
+    cancel_event: threading.Event | None = None,
+    reserved: list[tuple[int, int]] | None = None,
+) -> list[int | None]:
+    """Place activities one at a time in the given order, cheapest window first."""
+    occupancy = _OccupancyIndex.with_reserved(len(grid), reserved)
+    starts: list[int | None] = []
+    for activity in activities:
+        _raise_if_cancelled(cancel_event)
+        start_index = _find_best_slot(activity, grid, occupancy, config, slot_minutes, cost_index)
+        starts.append(start_index)
+        if start_index is None:
+            continue
+        required_slots = math.ceil(_required_minutes(activity, slot_minutes) / slot_minutes)
+        occupancy.occupy(start_index, required_slots)
+    return starts
 
 
 def _find_best_slot(
     activity: ActivityDefinition,
-    slots: list[_PlannerSlot],
-    occupancy: list[bool],
+    grid: _SlotGrid,
+    occupancy: _OccupancyIndex,
     config: EnergyAdvisorConfig,
     slot_minutes: int,
-) -> tuple[ScheduledActivity, list[int]] | None:
-    required_minutes = max(activity.duration_minutes, slot_minutes)
+    cost_index: _CostIndex | _NumpyCostIndex | None = None,
+) -> int | None:
+    required_minutes = _required_minutes(activity, slot_minutes)
     required_slots = math.ceil(required_minutes / slot_minutes)
 
-    best_cost: Decimal | None = None
-    best_indices: list[int] | None = None
-
-    for index in range(0, len(slots) - required_slots + 1):
-        candidate_slots = slots[index : index + required_slots]
-        if any(occupancy[slot.index] for slot in candidate_slots):
-            continue
-
-        if not _slots_within_constraints(candidate_slots, activity, config, required_minutes):
-            continue
+    if cost_index is None:
+        return _scan_best_start(
+            activity, grid, occupancy, config, slot_minutes, required_minutes, required_slots
+        )
+    return cost_index.best_start(
+        activity, grid, occupancy, config, required_minutes, required_slots
+    )
 
-        cost = _calculate_cost(candidate_slots, required_minutes, slot_minutes)
-        if best_cost is None or cost < best_cost:
-            best_cost = cost
-            best_indices = [slot.index for slot in candidate_slots]
 
-    if best_cost is None or best_indices is None:
-        return None
+def _reserved_windows(
+    grid: _SlotGrid, pinned: list[ScheduledActivity]
+) -> list[tuple[int, int]]:
+    """Return the ``(start, length)`` slot windows still covered by pinned placements."""
+    step = grid.series.resolution_minutes * 60
+    origin = grid.series.start_ts
+    windows: list[tuple[int, int]] = []
+    for placement in pinned:
+        first = max(0, (int(placement.start.timestamp()) - origin) // step)
+        stop = min(len(grid), -(-(int(placement.end.timestamp()) - origin) // step))
+        if first < stop:
+            windows.append((first, stop - first))
+    return windows
 
-    selected_slots = [slots[i] for i in best_indices]
-    start_dt = selected_slots[0].start
-    end_dt = start_dt + timedelta(minutes=required_minutes)
-    cost = _calculate_cost(selected_slots, required_minutes, slot_minutes)
 
-    scheduled = ScheduledActivity(
+def _build_placement(
+    activity: ActivityDefinition,
+    grid: _SlotGrid,
+    start_index: int,
+    slot_minutes: int,
+) -> ScheduledActivity:
+    """Materialise the Decimal view of a placement starting at ``start_index``."""
+    required_minutes = _required_minutes(activity, slot_minutes)
+    required_slots = math.ceil(required_minutes / slot_minutes)
+    selected = grid.series[start_index : start_index + required_slots]
+    return ScheduledActivity(
         activity_id=activity.id,
-        start=start_dt,
-        end=end_dt,
-        slot_prices=[slot.price for slot in selected_slots],
-        cost=cost,
+        start=grid.starts[start_index],
+        end=grid.local_time(grid.timestamps[start_index] + required_minutes * 60),
+        slot_prices=selected,
+        cost=_calculate_cost(selected, required_minutes, slot_minutes),
     )
-    return scheduled, best_indices
 
 
-def _slots_within_constraints(
-    candidate_slots: list[_PlannerSlot],
+def _raise_if_cancelled(cancel_event: threading.Event | None) -> None:
+    if cancel_event is not None and cancel_event.is_set():
+        raise PlanningCancelled("Planning run was cancelled")
+
+
+class _SolverBudgetExceeded(Exception):
+    """Raised internally when the exact solver runs out of time."""
+
+
+def _place_optimal(
+    activities: list[ActivityDefinition],
+    grid: _SlotGrid,
+    config: EnergyAdvisorConfig,
+    slot_minutes: int,
+    greedy_starts: list[int | None],
+    cancel_event: threading.Event | None = None,
+    reserved: list[tuple[int, int]] | None = None,
+) -> list[int | None]:
+    """Search for the placement that schedules most activities at the lowest cost.
+
+    Branch-and-bound over the activities in greedy order. Each activity either
+    takes one of its feasible windows (tried cheapest first) or stays
+    unscheduled. Solutions are ranked by ``(unscheduled count, total cost)`` and a
+    branch is pruned when its cost plus the cheapest standalone window of every
+    remaining activity cannot beat the incumbent, which starts as the greedy
+    result. If the wall-clock budget runs out the greedy result is returned.
+    """
+    deadline = time_module.monotonic() + config.solver_time_budget
+    cost_index = _CostIndex.build(grid.series, slot_minutes)
+
+    lengths: list[int] = []
+    candidates: list[list[tuple[int, int]]] = []
+    for activity in activities:
+        _raise_if_cancelled(cancel_event)
+        if time_module.monotonic() > deadline:
+            LOGGER.debug("Exact solver budget exhausted while collecting candidates")
+            return list(greedy_starts)
+        required_minutes = _required_minutes(activity, slot_minutes)
+        required_slots = math.ceil(required_minutes / slot_minutes)
+        last_portion = required_minutes - (required_slots - 1) * slot_minutes
+        last_start = len(grid) - required_slots
+        options = [
+            (cost_index.window_score(index, required_slots, last_portion), index)
+            for feasible in grid.feasible_starts(activity, config, required_minutes)
+            for index in feasible
+            if index <= last_start
+        ]
+        options.sort()
+        lengths.append(required_slots)
+        candidates.append(options)
+
+    count = len(activities)
+    remaining_bound = [0] * (count + 1)
+    for position in range(count - 1, -1, -1):
+        cheapest = candidates[position][0][0] if candidates[position] else 0
+        remaining_bound[position] = remaining_bound[position + 1] + cheapest
+
+    greedy_cost = 0
+    greedy_missing = 0
+    for position, start_index in enumerate(greedy_starts):
+        if start_index is None:
+            greedy_missing += 1
+            continue
+        required_slots = lengths[position]
+        last_portion = _required_minutes(activities[position], slot_minutes) - (
+            required_slots - 1
+        ) * slot_minutes
+        greedy_cost += cost_index.window_score(start_index, required_slots, last_portion)
+
+    best: tuple[int, int] = (greedy_missing, greedy_cost)
+    best_starts: list[int | None] = list(greedy_starts)
+    current: list[int | None] = [None] * count
+    occupancy = _OccupancyIndex.with_reserved(len(grid), reserved)
+    nodes = 0
+
+    def search(position: int, missing: int, cost: int) -> None:
+        nonlocal best, best_starts, nodes
+        nodes += 1
+        if nodes & 0xFF == 0:
+            _raise_if_cancelled(cancel_event)
+            if time_module.monotonic() > deadline:
+                raise _SolverBudgetExceeded
+
+        if position == count:
+            if (missing, cost) < best:
+                best = (missing, cost)
+                best_starts = list(current)
+            return
+
+        required_slots = lengths[position]
+        bound_after = remaining_bound[position + 1]
+        for score, index in candidates[position]:
+            if (missing, cost + score + bound_after) >= best:
+                break
+            if not occupancy.is_free(index, required_slots):
+                continue
+            occupancy.occupy(index, required_slots)
+            current[position] = index
+            search(position + 1, missing, cost + score)
+            occupancy.release(index, required_slots)
+        current[position] = None
+
+        if (missing + 1, cost + bound_after) < best:
+            search(position + 1, missing + 1, cost)
+
+    try:
+        search(0, 0, 0)
+    except _SolverBudgetExceeded:
+        LOGGER.debug(
+            "Exact solver exceeded %.2fs budget; keeping greedy placement",
+            config.solver_time_budget,
+        )
+        return list(greedy_starts)
+    return best_starts
+
+
+def _scan_best_start(
     activity: ActivityDefinition,
+    grid: _SlotGrid,
+    occupancy: _OccupancyIndex,
     config: EnergyAdvisorConfig,
+    slot_minutes: int,
     required_minutes: int,
-) -> bool:
-    start_dt = candidate_slots[0].start
-    end_dt = start_dt + timedelta(minutes=required_minutes)
-
-    window_start = _combine_with_date(start_dt, activity.earliest_start or config.window_start)
-    window_end = _combine_with_date(start_dt, activity.latest_end or config.window_end)
+    required_slots: int,
+) -> int | None:
+    """Reference search that re-sums every candidate window."""
+    best_cost: Decimal | None = None
+    best_index: int | None = None
 
-    if start_dt < window_start or end_dt > window_end:
-        return False
+    candidates = grid.candidate_starts(
+        activity, config, occupancy, required_minutes, required_slots
+    )
+    for index in candidates:
+        candidate = grid.series[index : index + required_slots]
+        cost = _calculate_cost(candidate, required_minutes, slot_minutes)
+        if best_cost is None or cost < best_cost:
+            best_cost = cost
+            best_index = index
 
-    return True
+    return best_index
 
 
 def _calculate_cost(
-    candidate_slots: Iterable[_PlannerSlot],
+    candidate: PriceSeries,
     required_minutes: int,
     slot_minutes: int,
 ) -> Decimal:
     remaining = required_minutes
     total = Decimal("0")
-    for slot in candidate_slots:
+    for index in range(len(candidate)):
         portion = min(slot_minutes, remaining)
-        total += slot.price_value * (Decimal(portion) / Decimal(60))
+        total += candidate.price_at(index) * (Decimal(portion) / Decimal(60))
         remaining -= portion
         if remaining <= 0:
             break
     return total
 
-
-def _combine_with_date(reference: datetime, tme: time) -> datetime:
-    return reference.replace(hour=tme.hour, minute=tme.minute, second=tme.second, microsecond=0)
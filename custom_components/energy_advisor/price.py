@@ -2,29 +2,97 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime
 from decimal import Decimal
-from typing import Iterable
+from typing import Any, Iterable
 
 from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import dt as dt_util
 
-from .models import PricePoint
+from .const import DATA_PRICE_CACHE
+from .models import PricePoint, PriceSeries
 
 RAW_PRICE_KEYS = ("raw_today", "raw_tomorrow")
+PRICE_CACHE_SIZE = 8
 
 
 class PriceExtractionError(HomeAssistantError):
     """Raised when price data cannot be extracted."""
 
 
-def extract_price_points(hass: HomeAssistant, entity_id: str) -> list[PricePoint]:
+class PriceSeriesCache:
+    """LRU cache of parsed price series keyed by sensor state identity.
+
+    A state is identified by entity id, ``last_updated`` and context id, so any
+    new state object misses the cache and evicts the entry of the previous
+    state of the same sensor. Cached series are shared between config entries
+    and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = PRICE_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], PriceSeries] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(state: State) -> tuple[Any, ...]:
+        return (state.entity_id, state.last_updated, state.context.id)
+
+    def get(self, state: State) -> PriceSeries | None:
+        """Return the parsed series for ``state`` if it is cached."""
+        key = self._key(state)
+        series = self._entries.get(key)
+        if series is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return series
+
+    def put(self, state: State, series: PriceSeries) -> None:
+        """Store the parsed series for ``state``, replacing older states of the sensor."""
+        for key in [key for key in self._entries if key[0] == state.entity_id]:
+            del self._entries[key]
+        self._entries[self._key(state)] = series
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current cache size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def get_price_cache(hass: HomeAssistant) -> PriceSeriesCache:
+    """Return the price series cache shared by all config entries."""
+    cache: PriceSeriesCache | None = hass.data.get(DATA_PRICE_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_PRICE_CACHE] = PriceSeriesCache()
+    return cache
+
+
+def extract_price_points(hass: HomeAssistant, entity_id: str) -> PriceSeries:
     """Parse raw price data from a sensor entity."""
     state = hass.states.get(entity_id)
     if state is None:
         raise PriceExtractionError(f"Sensor {entity_id} is unavailable")
 
+    cache = get_price_cache(hass)
+    series = cache.get(state)
+    if series is None:
+        series = price_series_from_state(state)
+        cache.put(state, series)
+    return series
+
+
+def price_series_from_state(state: State) -> PriceSeries:
+    """Parse raw price data from a captured sensor state.
+
+    Does not touch the state machine, so it is safe to run in an executor.
+    """
     raw = _collect_raw_entries(state)
     if not raw:
         raise PriceExtractionError("Price sensor does not expose raw price data")
@@ -45,8 +113,33 @@ def extract_price_points(hass: HomeAssistant, entity_id: str) -> list[PricePoint
     if not points:
         raise PriceExtractionError("No valid entries extracted from price sensor")
 
-    points.sort(key=lambda item: item.start)
-    return points
+    try:
+        return PriceSeries.from_points(points)
+    except ValueError as exc:
+        raise PriceExtractionError(str(exc)) from exc
+
+
+def price_fingerprint(state: State | None) -> int | None:
+    """Return a cheap fingerprint of the raw price attributes of a state.
+
+    Nordpool-style sensors change their state every slot while the raw price
+    lists stay the same; comparing fingerprints lets callers skip work when
+    only the current price moved.
+    """
+    if state is None:
+        return None
+    raw = _collect_raw_entries(state)
+    if not raw:
+        return None
+    return hash(
+        (
+            len(raw),
+            str(raw[0]["start"]),
+            str(raw[-1]["end"]),
+            tuple(str(entry["value"]) for entry in raw),
+            state.attributes.get("currency") or state.attributes.get("unit_of_measurement", ""),
+        )
+    )
 
 
 def _collect_raw_entries(state: State) -> list[dict[str, str]]:
@@ -0,0 +1,110 @@
+"""Single-flight refresh scheduling for Energy Advisor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER
+
+
+class RefreshScheduler:
+    """Coalesce refresh requests into debounced, single-flight runs.
+
+    Requests made within the debounce window share one run. Requests made while
+    a run is in flight are collected and served by exactly one follow-up run,
+    so at most one computation is active at any time. Every caller can await
+    the run that covers its request.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        cooldown: float,
+        job: Callable[[], Awaitable[None]],
+        name: str,
+    ) -> None:
+        self._hass = hass
+        self._cooldown = cooldown
+        self._job = job
+        self._name = name
+        self._waiters: list[asyncio.Future[None]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._pending = False
+        self.requests = 0
+        self.runs = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return request and run counters."""
+        return {"requests": self.requests, "runs": self.runs}
+
+    async def async_request(self) -> None:
+        """Request a run and wait until a run covering this request finished."""
+        waiter: asyncio.Future[None] = self._hass.loop.create_future()
+        self._waiters.append(waiter)
+        self.requests += 1
+        self._schedule()
+        await waiter
+
+    @callback
+    def async_schedule(self) -> None:
+        """Request a run without waiting for it."""
+        self.requests += 1
+        self._pending = True
+        self._schedule()
+
+    def async_cancel(self) -> None:
+        """Cancel pending and in-flight runs."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending = False
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.cancel()
+
+    def _schedule(self) -> None:
+        if self._task is not None or self._timer is not None:
+            return
+        self._timer = self._hass.loop.call_later(self._cooldown, self._start)
+
+    def _start(self) -> None:
+        self._timer = None
+        waiters, self._waiters = self._waiters, []
+        pending, self._pending = self._pending, False
+        if not waiters and not pending:
+            return
+        self._task = self._hass.async_create_background_task(
+            self._run(waiters), name=f"{self._name} refresh"
+        )
+
+    async def _run(self, waiters: list[asyncio.Future[None]]) -> None:
+        self.runs += 1
+        LOGGER.debug("%s: running refresh for %s coalesced request(s)", self._name, len(waiters))
+        try:
+            await self._job()
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.cancel()
+            raise
+        except Exception as exc:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+        finally:
+            self._task = None
+            if self._waiters or self._pending:
+                self._schedule()
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from datetime import datetime
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ATTRIBUTION
+from homeassistant.const import ATTR_ATTRIBUTION, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    ATTR_ACTIVITY_COST,
+    ATTR_ACTIVITY_END,
+    ATTR_ACTIVITY_ID,
     ATTR_PLAN_ACTIVITIES,
     ATTR_PLAN_AVERAGE_PRICE,
     ATTR_PLAN_GENERATED_AT,
     ATTR_PLAN_HORIZON_END,
     ATTR_PLAN_HORIZON_START,
+    ATTR_PLAN_SCHEDULED,
     ATTR_PLAN_TOTAL_COST,
     ATTR_PLAN_UNSCHEDULED,
     DOMAIN,
 )
 from .coordinator import EnergyAdvisorCoordinator
+from .entity import EnergyAdvisorActivityEntity, async_track_activity_entities, device_info
 from .manager import EnergyAdvisorRuntimeData, get_coordinator
-from .models import ScheduleSolution
+from .models import ActivityDefinition, ScheduleSolution
 
 ENTITY_NAME = "Energy Advisor Plan"
 ENTITY_ICON = "mdi:calendar-clock"
@@ -38,6 +45,13 @@ async def async_setup_entry(
     coordinator: EnergyAdvisorCoordinator = get_coordinator(runtime)
     async_add_entities([EnergyAdvisorPlanSensor(coordinator, entry)])
 
+    def _activity_sensor(activity: ActivityDefinition) -> EnergyAdvisorActivitySensor:
+        return EnergyAdvisorActivitySensor(coordinator, entry, activity)
+
+    async_track_activity_entities(
+        hass, entry, coordinator, async_add_entities, Platform.SENSOR, _activity_sensor
+    )
+
 
 class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], SensorEntity):
     """Sensor exposing the computed plan."""
@@ -46,11 +60,16 @@ class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], Senso
     _attr_name = "Plan"
     _attr_icon = ENTITY_ICON
     _attr_suggested_object_id = "energy_advisor_plan"
+    # Per-activity placements and slot prices are large and change with every
+    # plan; keep them out of the recorder and record only the summary.
+    _unrecorded_attributes = frozenset({ATTR_PLAN_ACTIVITIES})
 
     def __init__(self, coordinator: EnergyAdvisorCoordinator, entry: ConfigEntry) -> None:
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_plan"
+        self._attributes_plan: ScheduleSolution | None = None
+        self._attributes: dict = {}
 
     @property
     def native_value(self) -> str | None:
@@ -64,6 +83,13 @@ class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], Senso
         plan: ScheduleSolution | None = self.coordinator.data
         if plan is None:
             return {}
+        if plan is not self._attributes_plan:
+            self._attributes = self._build_attributes(plan)
+            self._attributes_plan = plan
+        return self._attributes
+
+    def _build_attributes(self, plan: ScheduleSolution) -> dict:
+        """Serialise the plan once; the result is reused until the plan changes."""
         return {
             ATTR_ATTRIBUTION: ATTR_ATTRIBUTION_TEXT,
             ATTR_PLAN_GENERATED_AT: plan.generated_at.isoformat(),
@@ -72,6 +98,7 @@ class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], Senso
             ATTR_PLAN_TOTAL_COST: str(plan.total_cost),
             ATTR_PLAN_AVERAGE_PRICE: str(plan.average_price),
             ATTR_PLAN_UNSCHEDULED: plan.unscheduled_activity_ids,
+            ATTR_PLAN_SCHEDULED: [activity.activity_id for activity in plan.activities],
             ATTR_PLAN_ACTIVITIES: [
                 {
                     "activity_id": activity.activity_id,
@@ -79,15 +106,7 @@ class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], Senso
                     "start": activity.start.isoformat(),
                     "end": activity.end.isoformat(),
                     "cost": str(activity.cost),
-                    "prices": [
-                        {
-                            "start": price.start.isoformat(),
-                            "end": price.end.isoformat(),
-                            "price": str(price.price),
-                            "currency": price.currency,
-                        }
-                        for price in activity.slot_prices
-                    ],
+                    "prices": activity.slot_price_dicts(),
                 }
                 for activity in plan.activities
             ],
@@ -95,7 +114,28 @@ class EnergyAdvisorPlanSensor(CoordinatorEntity[EnergyAdvisorCoordinator], Senso
 
     @property
     def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name="Energy Advisor",
-        )
+        return device_info(self._entry)
+
+
+class EnergyAdvisorActivitySensor(EnergyAdvisorActivityEntity, SensorEntity):
+    """Sensor exposing the planned start, end and cost of one activity."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:clock-start"
+    _unique_id_suffix = "next_start"
+
+    @property
+    def native_value(self) -> datetime | None:
+        placement = self.placement
+        return placement.start if placement is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        placement = self.placement
+        if placement is None:
+            return {ATTR_ACTIVITY_ID: self.activity_id}
+        return {
+            ATTR_ACTIVITY_ID: self.activity_id,
+            ATTR_ACTIVITY_END: placement.end.isoformat(),
+            ATTR_ACTIVITY_COST: str(placement.cost),
+        }
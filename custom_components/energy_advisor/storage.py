@@ -3,13 +3,31 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from homeassistant.helpers.storage import Store
-
-from .const import DOMAIN, STORAGE_KEY_ACTIVITIES, STORAGE_VERSION
-from .models import ActivityDefinition, StoredActivity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    STORAGE_KEY_ACTIVITIES,
+    STORAGE_KEY_PLAN,
+    STORAGE_KEY_PRICES,
+    STORAGE_VERSION,
+)
+from .models import (
+    ActivityDefinition,
+    PriceSeries,
+    ScheduledActivity,
+    ScheduleSolution,
+    StoredActivity,
+)
+
+PLAN_SAVE_DELAY_SECONDS = 30
 
 
 @dataclass(slots=True)
@@ -18,20 +36,45 @@ class EnergyAdvisorStorageState:
 
     version: int = STORAGE_VERSION
     activities: list[StoredActivity] = field(default_factory=list)
+    plan: ScheduleSolution | None = None
+    prices: PriceSeries | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "EnergyAdvisorStorageState":
-        """Create storage state from raw dict."""
+        """Create storage state from raw dict.
+
+        A plan or price snapshot that cannot be parsed is dropped; it is only
+        a warm-start hint and is replaced by the next refresh.
+        """
         stored = [
             StoredActivity(**activity) for activity in data.get(STORAGE_KEY_ACTIVITIES, [])
         ]
-        return cls(version=data.get("version", STORAGE_VERSION), activities=stored)
+        plan: ScheduleSolution | None = None
+        prices: PriceSeries | None = None
+        try:
+            if data.get(STORAGE_KEY_PRICES):
+                prices = _series_from_dict(data[STORAGE_KEY_PRICES])
+            if data.get(STORAGE_KEY_PLAN):
+                plan = _plan_from_dict(data[STORAGE_KEY_PLAN], prices)
+        except (KeyError, TypeError, ValueError, InvalidOperation) as exc:
+            LOGGER.warning("Discarding unreadable stored plan: %s", exc)
+            plan = prices = None
+        return cls(
+            version=data.get("version", STORAGE_VERSION),
+            activities=stored,
+            plan=plan,
+            prices=prices,
+        )
 
     def as_dict(self) -> dict[str, Any]:
         """Serialize to dict for storage."""
         return {
             "version": self.version,
             STORAGE_KEY_ACTIVITIES: [asdict(activity) for activity in self.activities],
+            STORAGE_KEY_PLAN: (
+                _plan_to_dict(self.plan, self.prices) if self.plan is not None else None
+            ),
+            STORAGE_KEY_PRICES: self.prices.to_snapshot() if self.prices is not None else None,
         }
 
     def to_definitions(self) -> list[ActivityDefinition]:
@@ -47,24 +90,143 @@ class EnergyAdvisorStorageState:
 
 
 class EnergyAdvisorStorage:
-    """HA store wrapper for Energy Advisor activities."""
+    """HA store wrapper for Energy Advisor activities and the last plan."""
 
     def __init__(self, store: Store) -> None:
         self._store = store
+        self.state = EnergyAdvisorStorageState()
 
     async def async_load(self) -> EnergyAdvisorStorageState:
         """Load persisted state from disk."""
         data: dict[str, Any] | None = await self._store.async_load()
         if not data:
-            return EnergyAdvisorStorageState()
-        return EnergyAdvisorStorageState.from_dict(data)
+            self.state = EnergyAdvisorStorageState()
+        else:
+            self.state = EnergyAdvisorStorageState.from_dict(data)
+        return self.state
 
     async def async_save(self, state: EnergyAdvisorStorageState) -> None:
         """Persist the provided state."""
+        self.state = state
         await self._store.async_save(state.as_dict())
 
+    def async_delay_save_plan(self, plan: ScheduleSolution, prices: PriceSeries) -> None:
+        """Remember the latest plan and its prices and write them after a short delay.
+
+        Plans change with every refresh; batching the writes keeps disk wear
+        low while HA still flushes pending saves on shutdown.
+        """
+        self.state.plan = plan
+        self.state.prices = prices
+        self._store.async_delay_save(self._data_to_save, PLAN_SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        """Delete the persisted state."""
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return self.state.as_dict()
+
     @classmethod
     def create(cls, hass, entry_id: str) -> "EnergyAdvisorStorage":  # type: ignore[override]
         """Factory helper to create a Store instance bound to the config entry."""
         store = Store(hass, STORAGE_VERSION, f"{DOMAIN}_{entry_id}", private=True)
         return cls(store)
+
+
+def _series_from_dict(data: dict[str, Any]) -> PriceSeries:
+    """Rebuild a price snapshot, preferring the zone key over the fixed offset."""
+    zone = dt_util.get_time_zone(data["timezone"]) if data.get("timezone") else None
+    if zone is None and data.get("utc_offset") is not None:
+        zone = timezone(timedelta(seconds=int(data["utc_offset"])))
+    elif zone is None and data.get("timezone"):
+        zone = dt_util.UTC
+    return PriceSeries.from_snapshot(data, zone)
+
+
+def _plan_to_dict(plan: ScheduleSolution, prices: PriceSeries | None) -> dict[str, Any]:
+    return {
+        "generated_at": plan.generated_at.isoformat(),
+        "horizon_start": plan.horizon_start.isoformat(),
+        "horizon_end": plan.horizon_end.isoformat(),
+        "total_cost": str(plan.total_cost),
+        "average_price": str(plan.average_price),
+        "unscheduled": list(plan.unscheduled_activity_ids),
+        "activities": [
+            {
+                "activity_id": placement.activity_id,
+                "start": placement.start.isoformat(),
+                "end": placement.end.isoformat(),
+                "cost": str(placement.cost),
+                "slots": _slot_range(placement, prices),
+            }
+            for placement in plan.activities
+        ],
+    }
+
+
+def _slot_range(placement: ScheduledActivity, prices: PriceSeries | None) -> list[int] | None:
+    """Return ``[offset, length, resolution]`` of the placement's planning slots.
+
+    The range indexes the persisted series resampled to the slot resolution of
+    the placement, which is coarser than the raw prices when the configured
+    slot length is.
+    """
+    slot_prices = placement.slot_prices
+    if prices is None or not slot_prices:
+        return None
+    if isinstance(slot_prices, PriceSeries):
+        resolution = slot_prices.resolution_minutes
+    else:
+        resolution = slot_prices[0].duration_minutes()
+    if resolution % prices.resolution_minutes:
+        return None
+    first = (int(placement.start.timestamp()) - prices.start_ts) // (resolution * 60)
+    length = len(slot_prices)
+    if first < 0 or (first + length) * resolution > len(prices) * prices.resolution_minutes:
+        return None
+    return [first, length, resolution]
+
+
+def _slot_prices(
+    data: list[int] | None,
+    prices: PriceSeries | None,
+    planning: dict[int, PriceSeries],
+    start: datetime,
+) -> PriceSeries | list:
+    if not data or prices is None:
+        return []
+    first, length, resolution = (int(value) for value in data)
+    series = planning.get(resolution)
+    if series is None:
+        series = planning[resolution] = prices.resample(resolution)
+    if first < 0 or length <= 0 or first + length > len(series):
+        raise ValueError("Stored slot range lies outside the price snapshot")
+    return replace(series[first : first + length], tzinfo=start.tzinfo)
+
+
+def _plan_from_dict(data: dict[str, Any], prices: PriceSeries | None) -> ScheduleSolution:
+    planning: dict[int, PriceSeries] = {}
+    return ScheduleSolution(
+        generated_at=datetime.fromisoformat(data["generated_at"]),
+        horizon_start=datetime.fromisoformat(data["horizon_start"]),
+        horizon_end=datetime.fromisoformat(data["horizon_end"]),
+        activities=[
+            ScheduledActivity(
+                activity_id=placement["activity_id"],
+                start=datetime.fromisoformat(placement["start"]),
+                end=datetime.fromisoformat(placement["end"]),
+                slot_prices=_slot_prices(
+                    placement.get("slots"),
+                    prices,
+                    planning,
+                    datetime.fromisoformat(placement["start"]),
+                ),
+                cost=Decimal(placement["cost"]),
+            )
+            for placement in data["activities"]
+        ],
+        total_cost=Decimal(data["total_cost"]),
+        average_price=Decimal(data["average_price"]),
+        unscheduled_activity_ids=list(data.get("unscheduled", [])),
+    )
@@ -0,0 +1,123 @@
+"""Tests for Energy Advisor binary sensor entities."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from decimal import Decimal
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.energy_advisor.binary_sensor import EnergyAdvisorActivityRunningSensor
+from custom_components.energy_advisor.const import DOMAIN
+from custom_components.energy_advisor.models import (
+    ActivityDefinition,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+
+
+class DummyCoordinator:
+    last_update_success = True
+
+    def __init__(self, hass, data):
+        self.hass = hass
+        self.data = data
+
+    def async_add_listener(self, update_callback, context=None):
+        return lambda: None
+
+    def get_activity_name(self, activity_id: str):
+        return {"wash": "Washer"}.get(activity_id)
+
+    def get_placement(self, activity_id: str):
+        if self.data is None:
+            return None
+        return next(
+            (item for item in self.data.activities if item.activity_id == activity_id), None
+        )
+
+
+def _plan(*placements: ScheduledActivity) -> ScheduleSolution:
+    return ScheduleSolution(
+        generated_at=placements[0].start,
+        horizon_start=placements[0].start,
+        horizon_end=placements[-1].end,
+        activities=list(placements),
+        total_cost=Decimal("0.3"),
+        average_price=Decimal("0.15"),
+    )
+
+
+async def test_running_sensor_switches_at_placement_start_and_end(hass, freezer) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    now = dt_util.utcnow().replace(microsecond=0)
+    wash = ScheduledActivity(
+        activity_id="wash",
+        start=now + timedelta(minutes=10),
+        end=now + timedelta(minutes=70),
+        slot_prices=[],
+        cost=Decimal("0.1"),
+    )
+    coordinator = DummyCoordinator(hass, _plan(wash))
+    sensor = EnergyAdvisorActivityRunningSensor(
+        coordinator, entry, ActivityDefinition(id="wash", name="Washer", duration_minutes=60)
+    )
+    sensor.hass = hass
+    await sensor.async_added_to_hass()
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.is_on)
+
+    assert sensor.is_on is False
+
+    freezer.move_to(wash.start)
+    async_fire_time_changed(hass, wash.start)
+    await hass.async_block_till_done()
+    assert writes == [True]
+
+    freezer.move_to(wash.end)
+    async_fire_time_changed(hass, wash.end)
+    await hass.async_block_till_done()
+    assert writes == [True, False]
+
+    sensor._cancel_transition()
+
+
+async def test_running_sensor_skips_writes_for_unchanged_placement(hass) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    now = dt_util.utcnow().replace(microsecond=0)
+    wash = ScheduledActivity(
+        activity_id="wash",
+        start=now - timedelta(hours=2),
+        end=now - timedelta(hours=1),
+        slot_prices=[],
+        cost=Decimal("0.1"),
+    )
+    dry = ScheduledActivity(
+        activity_id="dry",
+        start=now - timedelta(hours=1),
+        end=now - timedelta(minutes=30),
+        slot_prices=[],
+        cost=Decimal("0.2"),
+    )
+    coordinator = DummyCoordinator(hass, _plan(wash, dry))
+    sensor = EnergyAdvisorActivityRunningSensor(
+        coordinator, entry, ActivityDefinition(id="wash", name="Washer", duration_minutes=60)
+    )
+    sensor.hass = hass
+    await sensor.async_added_to_hass()
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.is_on)
+
+    coordinator.data = _plan(wash, replace(dry, cost=Decimal("0.3")))
+    sensor._handle_coordinator_update()
+    coordinator.data = _plan(replace(wash), dry)
+    sensor._handle_coordinator_update()
+    assert writes == []
+
+    coordinator.data = _plan(replace(wash, end=now + timedelta(minutes=5)), dry)
+    sensor._handle_coordinator_update()
+    assert writes == [True]
+
+    sensor._cancel_transition()
@@ -0,0 +1,91 @@
+"""Tests for the Energy Advisor calendar."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from decimal import Decimal
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energy_advisor.calendar import EnergyAdvisorCalendar
+from custom_components.energy_advisor.const import DOMAIN
+from custom_components.energy_advisor.history import PlanHistory
+from custom_components.energy_advisor.models import ScheduledActivity, ScheduleSolution
+
+
+class DummyCoordinator:
+    last_update_success = True
+
+    def __init__(self, data, history=None):
+        self.data = data
+        self.history = history
+
+    def async_add_listener(self, update_callback, context=None):
+        return lambda: None
+
+    def get_activity_name(self, activity_id: str):
+        return {"wash": "Washer"}.get(activity_id)
+
+
+def _placement(activity_id: str, start, minutes: int) -> ScheduledActivity:
+    return ScheduledActivity(
+        activity_id=activity_id,
+        start=start,
+        end=start + timedelta(minutes=minutes),
+        slot_prices=[],
+        cost=Decimal("0.5"),
+    )
+
+
+def _plan(generated_at, *placements: ScheduledActivity) -> ScheduleSolution:
+    return ScheduleSolution(
+        generated_at=generated_at,
+        horizon_start=placements[0].start,
+        horizon_end=placements[-1].end,
+        activities=list(placements),
+        total_cost=Decimal("1"),
+        average_price=Decimal("0.5"),
+    )
+
+
+async def test_calendar_range_queries_include_replaced_plans(hass) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    now = dt_util.utcnow().replace(microsecond=0)
+    history = PlanHistory.create(hass, entry.entry_id)
+    long_ago = _placement("wash", now - timedelta(hours=5), 240)
+    running = _placement("dry", now - timedelta(minutes=10), 60)
+    first = _plan(now - timedelta(hours=6), long_ago, running)
+    history.async_append(first)
+    coordinator = DummyCoordinator(first, history)
+    calendar = EnergyAdvisorCalendar(coordinator, entry)
+
+    assert calendar.event.summary == "dry"
+
+    later = replace(running, start=now + timedelta(hours=2), end=now + timedelta(hours=3))
+    coordinator.data = _plan(now, later)
+    history.async_append(coordinator.data)
+
+    events = await calendar.async_get_events(hass, now - timedelta(hours=2), now)
+    assert [event.summary for event in events] == ["Washer", "dry"]
+
+    # Queries bisect the persistent index; the history is only read once.
+    history.iter_plans = None
+    history.latest_before = None
+
+    events = await calendar.async_get_events(
+        hass, now + timedelta(hours=1), now + timedelta(days=1)
+    )
+    assert [event.start for event in events] == [later.start]
+
+    events = await calendar.async_get_events(
+        hass, now - timedelta(days=2), now - timedelta(days=1)
+    )
+    assert events == []
+
+    calendar.async_write_ha_state = lambda: None
+    calendar._handle_coordinator_update()
+    assert calendar.event.start == running.start
+
+    await hass.async_block_till_done()
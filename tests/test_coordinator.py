@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
-from datetime import datetime, time, timezone
+import asyncio
+import threading
+import time as time_module
+from dataclasses import replace
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
+from custom_components.energy_advisor import coordinator as coordinator_module
 from custom_components.energy_advisor.config import build_entry_data
 from custom_components.energy_advisor.const import DOMAIN
-from custom_components.energy_advisor.coordinator import EnergyAdvisorCoordinator
+from custom_components.energy_advisor.coordinator import (
+    REFRESH_DEBOUNCE_SECONDS,
+    EnergyAdvisorCoordinator,
+    next_refresh_time,
+)
 from custom_components.energy_advisor.manager import async_create_runtime_data, set_coordinator
-from custom_components.energy_advisor.models import ActivityDefinition, EnergyAdvisorConfig
+from custom_components.energy_advisor.models import (
+    ActivityDefinition,
+    EnergyAdvisorConfig,
+    PricePoint,
+    PriceSeries,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+from custom_components.energy_advisor.planner import PlanMemo
 
 
 async def test_coordinator_generates_plan(hass) -> None:
@@ -62,11 +84,17 @@ async def test_coordinator_generates_plan(hass) -> None:
     coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
     set_coordinator(runtime, coordinator)
 
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_refresh()
 
     assert coordinator.data is not None
     assert coordinator.data.activities
     assert coordinator.data.activities[0].activity_id == "wash"
+    assert coordinator.last_plan_duration is not None
+
+    plan = coordinator.data
+    await coordinator.async_refresh()
+    assert coordinator.refreshes_executed == 2
+    assert coordinator.data is plan
 
 
 async def test_async_update_activities_refreshes_plan(hass) -> None:
@@ -107,7 +135,7 @@ async def test_async_update_activities_refreshes_plan(hass) -> None:
     coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
     set_coordinator(runtime, coordinator)
 
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_refresh()
     assert coordinator.data is not None
     assert coordinator.data.activities == []
 
@@ -118,3 +146,415 @@ async def test_async_update_activities_refreshes_plan(hass) -> None:
     assert coordinator.data is not None
     assert coordinator.data.activities
     assert coordinator.data.activities[0].activity_id == "wash"
+
+
+async def test_renamed_activity_publishes_unchanged_schedule(hass) -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    hass.states.async_set(
+        "sensor.nordpool",
+        "0.10",
+        {
+            "currency": "SEK",
+            "raw_today": [
+                {
+                    "start": start.isoformat(),
+                    "end": start.replace(minute=15).isoformat(),
+                    "value": 0.10,
+                },
+                {
+                    "start": start.replace(minute=15).isoformat(),
+                    "end": start.replace(minute=30).isoformat(),
+                    "value": 0.15,
+                },
+            ],
+        },
+    )
+
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    runtime.activities = [ActivityDefinition(id="wash", name="Washing", duration_minutes=15)]
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+
+    await coordinator.async_refresh()
+    plan = coordinator.data
+    updates = []
+    unsub = coordinator.async_add_listener(lambda: updates.append(coordinator.data))
+
+    await coordinator.async_update_activities(
+        [ActivityDefinition(id="wash", name="Laundry", duration_minutes=15)]
+    )
+
+    assert coordinator.data is not plan
+    assert coordinator.data.same_schedule(plan)
+    assert updates == [coordinator.data]
+    assert coordinator.get_activity_name("wash") == "Laundry"
+
+    await coordinator.async_refresh()
+    assert updates == [coordinator.data]
+
+    unsub()
+    await coordinator.async_unload()
+
+
+async def test_planning_timeout_marks_refresh_failed(hass, monkeypatch) -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    hass.states.async_set(
+        "sensor.nordpool",
+        "0.10",
+        {
+            "currency": "SEK",
+            "raw_today": [
+                {
+                    "start": start.isoformat(),
+                    "end": start.replace(minute=15).isoformat(),
+                    "value": 0.10,
+                }
+            ],
+        },
+    )
+
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    runtime.config = replace(runtime.config, planning_timeout=0.05)
+
+    def _slow_plan(*args, **kwargs):
+        time_module.sleep(0.5)
+
+    monkeypatch.setattr(coordinator_module, "_compute_plan", _slow_plan)
+
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is False
+    assert coordinator.data is None
+
+
+async def test_price_event_without_new_prices_is_skipped(hass) -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    raw_today = [
+        {
+            "start": start.isoformat(),
+            "end": start.replace(minute=15).isoformat(),
+            "value": 0.10,
+        },
+        {
+            "start": start.replace(minute=15).isoformat(),
+            "end": start.replace(minute=30).isoformat(),
+            "value": 0.20,
+        },
+    ]
+    hass.states.async_set("sensor.nordpool", "0.10", {"currency": "SEK", "raw_today": raw_today})
+
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+
+    coordinator.async_start()
+    await coordinator.async_refresh()
+    assert coordinator.refresh_stats == {"executed": 1, "skipped": 0}
+
+    hass.states.async_set("sensor.nordpool", "0.20", {"currency": "SEK", "raw_today": raw_today})
+    await hass.async_block_till_done()
+    assert coordinator.refresh_stats == {"executed": 1, "skipped": 1}
+
+    updated = [*raw_today]
+    updated[1] = {**raw_today[1], "value": 0.05}
+    hass.states.async_set("sensor.nordpool", "0.20", {"currency": "SEK", "raw_today": updated})
+    await hass.async_block_till_done()
+    assert coordinator.refresh_stats == {"executed": 1, "skipped": 1}
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=REFRESH_DEBOUNCE_SECONDS))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.refresh_stats == {"executed": 2, "skipped": 1}
+
+    await coordinator.async_unload()
+
+
+async def test_concurrent_refresh_requests_are_coalesced(hass) -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    hass.states.async_set(
+        "sensor.nordpool",
+        "0.10",
+        {
+            "currency": "SEK",
+            "raw_today": [
+                {
+                    "start": start.isoformat(),
+                    "end": start.replace(minute=15).isoformat(),
+                    "value": 0.10,
+                }
+            ],
+        },
+    )
+
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+
+    results = await asyncio.gather(
+        coordinator.async_request_plan(),
+        coordinator.async_request_refresh(),
+        coordinator.async_refresh(),
+        coordinator.async_request_plan(),
+    )
+
+    assert coordinator.refreshes_executed == 1
+    assert coordinator.scheduler_stats == {"requests": 4, "runs": 1}
+    assert results[0] is not None
+    assert results[0] is results[3]
+
+    await coordinator.async_unload()
+
+
+def test_compute_plan_trims_elapsed_slots_and_keeps_pinned() -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    series = PriceSeries.from_points(
+        PricePoint(
+            start=start + timedelta(minutes=15 * index),
+            end=start + timedelta(minutes=15 * (index + 1)),
+            price=Decimal(str(price)),
+            currency="SEK",
+        )
+        for index, price in enumerate([0.05, 0.05, 0.10, 0.10, 0.30, 0.30, 0.20, 0.20])
+    )
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=30,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+        rolling_horizon=True,
+    )
+    running = ScheduledActivity(
+        activity_id="dry",
+        start=start,
+        end=start + timedelta(minutes=45),
+        slot_prices=series[0:3],
+        cost=Decimal("0.1"),
+    )
+    activities = [
+        ActivityDefinition(id="wash", name="Washing", duration_minutes=30),
+        ActivityDefinition(id="dry", name="Dryer", duration_minutes=45),
+    ]
+
+    returned, plan = coordinator_module._compute_plan(
+        None,
+        series,
+        config,
+        activities,
+        threading.Event(),
+        PlanMemo(),
+        start + timedelta(minutes=20),
+        [running],
+    )
+
+    assert returned is series
+    assert plan.horizon_start == start + timedelta(minutes=30)
+    assert plan.activities[0] is running
+    wash = plan.activities[1]
+    assert wash.activity_id == "wash"
+    assert wash.start == start + timedelta(minutes=90)
+    assert plan.unscheduled_activity_ids == []
+
+
+def test_next_refresh_time_picks_nearest_boundary() -> None:
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    series = PriceSeries.from_points(
+        PricePoint(
+            start=start + timedelta(minutes=15 * index),
+            end=start + timedelta(minutes=15 * (index + 1)),
+            price=Decimal("0.1"),
+            currency="SEK",
+        )
+        for index in range(8)
+    )
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=30,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    wash = ScheduledActivity(
+        activity_id="wash",
+        start=start + timedelta(minutes=50),
+        end=start + timedelta(minutes=80),
+        slot_prices=series[3:6],
+        cost=Decimal("0.1"),
+    )
+    plan = ScheduleSolution(
+        generated_at=start,
+        horizon_start=start,
+        horizon_end=series.end,
+        activities=[wash],
+        total_cost=Decimal("0.1"),
+        average_price=Decimal("0.1"),
+        unscheduled_activity_ids=[],
+    )
+
+    def _at(minutes: int) -> datetime:
+        return start + timedelta(minutes=minutes)
+
+    assert next_refresh_time(_at(40), config, series, None) == _at(60)
+    assert next_refresh_time(_at(40), config, series, plan) == _at(50)
+    assert next_refresh_time(_at(60), config, series, plan) == _at(80)
+    assert next_refresh_time(_at(110), config, series, plan) == _at(13 * 60)
+    assert next_refresh_time(_at(14 * 60), config, series, plan) == _at(24 * 60)
+    assert next_refresh_time(_at(14 * 60), config, None, None) == _at(24 * 60)
+
+    rolling = replace(config, rolling_horizon=True, min_lead_minutes=20)
+    assert next_refresh_time(_at(35), rolling, series, None) == _at(40)
+
+
+async def test_restored_plan_is_published_until_prices_arrive(hass) -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    runtime.activities = [ActivityDefinition(id="wash", name="Washing", duration_minutes=60)]
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    series = PriceSeries.from_points(
+        PricePoint(
+            start=start + timedelta(hours=index),
+            end=start + timedelta(hours=index + 1),
+            price=Decimal("0.1"),
+            currency="SEK",
+        )
+        for index in range(3)
+    )
+    plan = ScheduleSolution(
+        generated_at=start,
+        horizon_start=start,
+        horizon_end=series.end,
+        activities=[
+            ScheduledActivity(
+                activity_id="wash",
+                start=series.start_at(1),
+                end=series.start_at(2),
+                slot_prices=series[1:2],
+                cost=Decimal("0.1"),
+            )
+        ],
+        total_cost=Decimal("0.1"),
+        average_price=Decimal("0.1"),
+    )
+    runtime.storage.state.plan = plan
+    runtime.storage.state.prices = series
+
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+
+    assert coordinator.async_restore_plan()
+    coordinator.async_start()
+    assert coordinator.data is plan
+    assert coordinator.last_update_success
+
+    hass.states.async_set("sensor.nordpool", "unavailable")
+    await hass.async_block_till_done()
+    assert coordinator.data is plan
+    assert coordinator.refreshes_executed == 0
+
+    await coordinator.async_unload()
+
+
+async def test_pinned_placements_use_configured_day(hass, freezer) -> None:
+    await hass.config.async_set_time_zone("America/Los_Angeles")
+    now = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+    freezer.move_to(now)
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="Europe/Stockholm",
+        rolling_horizon=True,
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    runtime.activities = [
+        ActivityDefinition(id="wash", name="Washing", duration_minutes=60),
+        ActivityDefinition(id="dry", name="Drying", duration_minutes=60),
+    ]
+    # Stockholm's day started at 23:00 UTC, Los Angeles' day only at 08:00 UTC.
+    yesterday = ScheduledActivity(
+        activity_id="dry",
+        start=datetime(2024, 12, 31, 21, 0, tzinfo=timezone.utc),
+        end=datetime(2024, 12, 31, 22, 0, tzinfo=timezone.utc),
+        slot_prices=[],
+        cost=Decimal("0.1"),
+    )
+    today = ScheduledActivity(
+        activity_id="wash",
+        start=datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc),
+        end=datetime(2025, 1, 1, 1, 0, tzinfo=timezone.utc),
+        slot_prices=[],
+        cost=Decimal("0.1"),
+    )
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    coordinator.async_set_updated_data(
+        ScheduleSolution(
+            generated_at=yesterday.start,
+            horizon_start=yesterday.start,
+            horizon_end=today.end,
+            activities=[yesterday, today],
+            total_cost=Decimal("0.2"),
+            average_price=Decimal("0.1"),
+        )
+    )
+
+    assert coordinator._pinned_placements(now) == [today]
@@ -0,0 +1,99 @@
+"""Tests for Energy Advisor diagnostics."""
+
+from __future__ import annotations
+
+from datetime import time, timedelta
+from decimal import Decimal
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energy_advisor.config import build_entry_data
+from custom_components.energy_advisor.const import CONF_PRICE_SENSOR, CONF_TIMEZONE, DOMAIN
+from custom_components.energy_advisor.coordinator import EnergyAdvisorCoordinator
+from custom_components.energy_advisor.diagnostics import async_get_config_entry_diagnostics
+from custom_components.energy_advisor.manager import async_create_runtime_data, set_coordinator
+from custom_components.energy_advisor.models import (
+    ActivityDefinition,
+    EnergyAdvisorConfig,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+
+
+async def test_diagnostics_reports_redacted_runtime_state(hass) -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="Europe/Stockholm",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    assert await async_get_config_entry_diagnostics(hass, entry) == {}
+
+    hass.data.setdefault(DOMAIN, {})
+    runtime = await async_create_runtime_data(hass, entry)
+    runtime.activities = [
+        ActivityDefinition(
+            id="wash", name="Washing", duration_minutes=15, metadata={"room": "Basement"}
+        )
+    ]
+    hass.data[DOMAIN][entry.entry_id] = runtime
+    coordinator = EnergyAdvisorCoordinator(hass, entry, runtime)
+    set_coordinator(runtime, coordinator)
+    generated = dt_util.utcnow().replace(microsecond=0) - timedelta(minutes=5)
+    plan = ScheduleSolution(
+        generated_at=generated,
+        horizon_start=generated,
+        horizon_end=generated + timedelta(hours=2),
+        activities=[
+            ScheduledActivity(
+                activity_id="wash",
+                start=generated + timedelta(minutes=30),
+                end=generated + timedelta(minutes=45),
+                slot_prices=[],
+                cost=Decimal("0.025"),
+            )
+        ],
+        total_cost=Decimal("0.025"),
+        average_price=Decimal("0.1"),
+        unscheduled_activity_ids=["dry"],
+    )
+    coordinator.async_set_updated_data(plan)
+    runtime.history.async_append(plan)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert set(diagnostics) == {
+        "config",
+        "activities",
+        "coordinator",
+        "plan",
+        "history",
+        "price_cache",
+    }
+    assert diagnostics["config"][CONF_PRICE_SENSOR] == "sensor.nordpool"
+    assert diagnostics["config"][CONF_TIMEZONE] == "**REDACTED**"
+    assert diagnostics["activities"][0]["name"] == "Washing"
+    assert diagnostics["activities"][0]["metadata"] == "**REDACTED**"
+    assert diagnostics["coordinator"]["last_update_success"] is True
+    assert diagnostics["coordinator"]["refresh_stats"] == {"executed": 0, "skipped": 0}
+    summary = {
+        "generated_at": generated.isoformat(),
+        "horizon_start": generated.isoformat(),
+        "horizon_end": (generated + timedelta(hours=2)).isoformat(),
+        "scheduled": 1,
+        "unscheduled": ["dry"],
+        "total_cost": "0.025",
+    }
+    assert diagnostics["plan"] == summary
+    assert diagnostics["history"]["plans"] == 1
+    latest = diagnostics["history"]["latest"]
+    assert latest["generated_at"] == dt_util.as_local(generated).isoformat()
+    assert latest["unscheduled"] == ["dry"]
+    assert latest["total_cost"] == "0.025000"
+
+    await coordinator.async_unload()
@@ -0,0 +1,75 @@
+"""Tests for the shared Energy Advisor entity helpers."""
+
+from __future__ import annotations
+
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.energy_advisor.const import DOMAIN
+from custom_components.energy_advisor.entity import async_track_activity_entities
+from custom_components.energy_advisor.models import ActivityDefinition
+from custom_components.energy_advisor.sensor import EnergyAdvisorActivitySensor
+
+
+class DummyCoordinator:
+    last_update_success = True
+    data = None
+
+    def __init__(self, activities):
+        self.activities = activities
+        self.listeners = []
+
+    def async_add_listener(self, update_callback, context=None):
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+    def get_activity_name(self, activity_id: str):
+        return next((item.name for item in self.activities if item.id == activity_id), None)
+
+    def get_placement(self, activity_id: str):
+        return None
+
+
+async def test_activity_entities_follow_activity_list(hass) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    wash = ActivityDefinition(id="wash", name="Washer", duration_minutes=60)
+    dry = ActivityDefinition(id="dry", name="Dryer", duration_minutes=90)
+    coordinator = DummyCoordinator([wash])
+    added = []
+
+    def _activity_sensor(activity: ActivityDefinition) -> EnergyAdvisorActivitySensor:
+        return EnergyAdvisorActivitySensor(coordinator, entry, activity)
+
+    async_track_activity_entities(
+        hass,
+        entry,
+        coordinator,
+        lambda entities: added.append([entity.activity_id for entity in entities]),
+        Platform.SENSOR,
+        _activity_sensor,
+    )
+    assert added == [["wash"]]
+    assert len(coordinator.listeners) == 1
+
+    registry = er.async_get(hass)
+    wash_entry = registry.async_get_or_create(
+        Platform.SENSOR, DOMAIN, f"{entry.entry_id}_wash_next_start", config_entry=entry
+    )
+
+    coordinator.activities = [wash, dry]
+    coordinator.listeners[0]()
+    assert added == [["wash"], ["dry"]]
+
+    coordinator.listeners[0]()
+    assert added == [["wash"], ["dry"]]
+
+    coordinator.activities = [dry]
+    coordinator.listeners[0]()
+    assert registry.async_get(wash_entry.entity_id) is None
+    assert added == [["wash"], ["dry"]]
+
+    coordinator.activities = [dry, wash]
+    coordinator.listeners[0]()
+    assert added == [["wash"], ["dry"], ["wash"]]
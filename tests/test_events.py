@@ -0,0 +1,67 @@
+"""Tests for Energy Advisor activity events."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import timedelta
+from decimal import Decimal
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.energy_advisor.const import EVENT_ACTIVITY_ENDED, EVENT_ACTIVITY_STARTED
+from custom_components.energy_advisor.events import ActivityEventTimers
+from custom_components.energy_advisor.models import ScheduledActivity, ScheduleSolution
+
+
+def _plan(*placements: ScheduledActivity) -> ScheduleSolution:
+    start = min(placement.start for placement in placements)
+    return ScheduleSolution(
+        generated_at=start,
+        horizon_start=start,
+        horizon_end=max(placement.end for placement in placements),
+        activities=list(placements),
+        total_cost=Decimal("0"),
+        average_price=Decimal("0"),
+    )
+
+
+async def test_activity_events_fire_at_placement_boundaries(hass) -> None:
+    started = async_capture_events(hass, EVENT_ACTIVITY_STARTED)
+    ended = async_capture_events(hass, EVENT_ACTIVITY_ENDED)
+    now = dt_util.utcnow().replace(microsecond=0)
+    wash = ScheduledActivity(
+        activity_id="wash",
+        start=now + timedelta(minutes=10),
+        end=now + timedelta(minutes=40),
+        slot_prices=[],
+        cost=Decimal("0.2"),
+    )
+    timers = ActivityEventTimers(hass, "entry", {"wash": "Washing"}.get)
+
+    timers.async_update(_plan(wash))
+    moved = replace(wash, start=now + timedelta(minutes=20), end=now + timedelta(minutes=50))
+    timers.async_update(_plan(moved))
+
+    async_fire_time_changed(hass, now + timedelta(minutes=15))
+    await hass.async_block_till_done()
+    assert started == []
+
+    async_fire_time_changed(hass, now + timedelta(minutes=20))
+    await hass.async_block_till_done()
+    assert len(started) == 1
+    assert started[0].data["activity_id"] == "wash"
+    assert started[0].data["name"] == "Washing"
+    assert started[0].data["start"] == moved.start.isoformat()
+
+    timers.async_update(_plan(replace(moved, cost=Decimal("0.3"))))
+    async_fire_time_changed(hass, now + timedelta(minutes=50))
+    await hass.async_block_till_done()
+    assert len(started) == 1
+    assert len(ended) == 1
+    assert ended[0].data["cost"] == "0.3"
+
+    timers.async_cancel()
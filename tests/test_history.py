@@ -0,0 +1,127 @@
+"""Tests for the Energy Advisor plan history."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from custom_components.energy_advisor.history import PlanHistory
+from custom_components.energy_advisor.models import ScheduledActivity, ScheduleSolution
+
+
+class FakeStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.saves = 0
+
+    async def async_load(self):
+        return self.data
+
+    def async_delay_save(self, data_func, delay):
+        self.saves += 1
+        self.data = data_func()
+
+
+def _plan(generated: datetime, start_hour: int, cost: str = "0.25") -> ScheduleSolution:
+    start = generated.replace(hour=start_hour)
+    return ScheduleSolution(
+        generated_at=generated,
+        horizon_start=generated,
+        horizon_end=generated + timedelta(days=1),
+        activities=[
+            ScheduledActivity(
+                activity_id="wash",
+                start=start,
+                end=start + timedelta(hours=1),
+                slot_prices=[],
+                cost=Decimal(cost),
+            )
+        ],
+        total_cost=Decimal(cost),
+        average_price=Decimal(cost),
+        unscheduled_activity_ids=["dry"],
+    )
+
+
+async def test_plan_history_keeps_distinct_plans_within_bounds() -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    store = FakeStore()
+    history = PlanHistory(store, max_plans=3, max_age=timedelta(days=1, hours=12))
+
+    assert history.async_append(_plan(base, 3))
+    repeated = replace(_plan(base, 3), generated_at=base + timedelta(hours=1))
+    assert not history.async_append(repeated)
+    for day in range(1, 4):
+        assert history.async_append(_plan(base + timedelta(days=day), 3 + day))
+
+    plans = list(history.iter_plans())
+    assert [plan.generated_at for plan in plans] == [
+        base + timedelta(days=2),
+        base + timedelta(days=3),
+    ]
+    assert plans[0].activities[0].start == base + timedelta(days=2, hours=5)
+    assert plans[0].activities[0].cost == Decimal("0.25")
+    assert plans[0].unscheduled_activity_ids == ["dry"]
+    assert store.data["ids"] == ["wash", "dry"]
+
+    window = list(history.iter_plans(base + timedelta(days=3), base + timedelta(days=4)))
+    assert [plan.generated_at for plan in window] == [base + timedelta(days=3)]
+    assert history.latest_before(base + timedelta(days=2, hours=12)).generated_at == (
+        base + timedelta(days=2)
+    )
+    # The window start is inclusive for iter_plans and exclusive for latest_before.
+    assert history.latest_before(base + timedelta(days=3)).generated_at == (
+        base + timedelta(days=2)
+    )
+
+    reloaded = PlanHistory(FakeStore(store.data))
+    await reloaded.async_load()
+    assert [plan.same_schedule(other) for plan, other in zip(reloaded.iter_plans(), plans)] == [
+        True,
+        True,
+    ]
+
+    bounded = PlanHistory(FakeStore(), max_plans=2)
+    for hour in range(3):
+        bounded.async_append(_plan(base + timedelta(hours=hour), 3 + hour))
+    assert len(bounded) == 2
+
+
+async def test_plan_history_drops_unreferenced_and_unknown_ids() -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    store = FakeStore()
+    history = PlanHistory(store, max_plans=2)
+
+    history.async_append(_plan(base, 3))
+    renamed = _plan(base + timedelta(hours=1), 4)
+    renamed.activities[0].activity_id = "laundry"
+    renamed.unscheduled_activity_ids = []
+    history.async_append(renamed)
+    assert store.data["ids"] == ["wash", "dry", "laundry"]
+
+    history.async_append(
+        replace(renamed, generated_at=base + timedelta(hours=2), total_cost=Decimal("1"))
+    )
+    assert store.data["ids"] == ["laundry"]
+    assert [plan.activities[0].activity_id for plan in history.iter_plans()] == [
+        "laundry",
+        "laundry",
+    ]
+
+    hour = int(base.timestamp())
+    reloaded = PlanHistory(
+        FakeStore(
+            {
+                "ids": ["wash", "dry"],
+                "plans": [
+                    [hour, hour, hour, 0, 0, [0, hour, hour + 3600, 0], [1]],
+                    [hour + 60, hour, hour, 0, 0, [2, hour, hour + 3600, 0], []],
+                    [hour + 120, hour, hour, 0, 0, [], [-1]],
+                ],
+            }
+        )
+    )
+    await reloaded.async_load()
+    assert [plan.generated_at for plan in reloaded.iter_plans()] == [base]
+    assert reloaded.latest_before(base + timedelta(hours=1)).unscheduled_activity_ids == ["dry"]
@@ -2,12 +2,19 @@
 
 from datetime import datetime, timedelta, timezone
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 from unittest.mock import AsyncMock
 
-from custom_components.energy_advisor import async_setup, async_setup_entry, async_unload_entry
+from custom_components.energy_advisor import (
+    async_remove_entry,
+    async_setup,
+    async_setup_entry,
+    async_unload_entry,
+)
 from custom_components.energy_advisor.config import build_entry_data
 from custom_components.energy_advisor.const import DOMAIN
+from custom_components.energy_advisor.coordinator import REFRESH_DEBOUNCE_SECONDS
 from custom_components.energy_advisor.manager import get_coordinator
 from custom_components.energy_advisor.models import EnergyAdvisorConfig
 
@@ -56,3 +63,64 @@ async def test_async_setup_and_unload_entry(hass) -> None:
 
     assert await async_unload_entry(hass, entry)
     assert entry.entry_id not in hass.data[DOMAIN]
+
+
+async def test_setup_entry_waits_for_price_sensor(hass) -> None:
+    """Setup succeeds without prices; the first plan follows the sensor's first state."""
+    await async_setup(hass, {})
+
+    hass.config_entries.async_forward_entry_setups = AsyncMock(return_value=None)
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+    now = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=now.time(),
+        window_end=now.replace(hour=23, minute=59).time(),
+        timezone="UTC",
+    )
+    entry = MockConfigEntry(domain=DOMAIN, data=build_entry_data(config))
+    entry.add_to_hass(hass)
+
+    assert await async_setup_entry(hass, entry)
+    coordinator = get_coordinator(hass.data[DOMAIN][entry.entry_id])
+    assert coordinator.data is None
+    hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+
+    hass.states.async_set(
+        "sensor.nordpool",
+        "0.10",
+        {
+            "raw_today": [
+                {
+                    "start": now.isoformat(),
+                    "end": (now + timedelta(minutes=15)).isoformat(),
+                    "value": 0.10,
+                }
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+    assert coordinator.data is None
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=REFRESH_DEBOUNCE_SECONDS))
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert coordinator.data is not None
+    assert coordinator.refreshes_executed == 1
+
+    assert await async_unload_entry(hass, entry)
+
+
+async def test_remove_entry_deletes_stored_plan_and_history(hass, hass_storage) -> None:
+    """Removing an entry deletes its plan store and its plan history store."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    for key in (f"{DOMAIN}_{entry.entry_id}", f"{DOMAIN}_{entry.entry_id}_history"):
+        hass_storage[key] = {"version": 1, "minor_version": 1, "key": key, "data": {}}
+
+    await async_remove_entry(hass, entry)
+
+    assert f"{DOMAIN}_{entry.entry_id}" not in hass_storage
+    assert f"{DOMAIN}_{entry.entry_id}_history" not in hass_storage
@@ -0,0 +1,132 @@
+"""Tests for Energy Advisor data models."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from custom_components.energy_advisor.models import (
+    PricePoint,
+    PriceSeries,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+
+
+def _points(*prices: str) -> list[PricePoint]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        PricePoint(
+            start=base + timedelta(minutes=15 * index),
+            end=base + timedelta(minutes=15 * (index + 1)),
+            price=Decimal(price),
+            currency="SEK",
+        )
+        for index, price in enumerate(prices)
+    ]
+
+
+def test_price_series_round_trips_points() -> None:
+    points = _points("0.10", "1", "-0.235", "2.0")
+
+    series = PriceSeries.from_points(reversed(points))
+
+    assert len(series) == 4
+    assert list(series) == points
+    assert [str(point.price) for point in series] == ["0.10", "1", "-0.235", "2.0"]
+    assert series.start == points[0].start
+    assert series.end == points[-1].end
+
+
+def test_price_series_slices_share_buffers() -> None:
+    points = _points("0.1", "0.2", "0.3", "0.4")
+    series = PriceSeries.from_points(points)
+
+    view = series[1:3]
+
+    assert view.values is series.values
+    assert view == points[1:3]
+    assert view.start == points[1].start
+    assert view[-1] == points[2]
+    with pytest.raises(IndexError):
+        view[2]
+
+
+def test_price_series_resample_averages_like_decimal() -> None:
+    points = _points("0.10", "1", "-0.235", "2.0", "0.5")
+
+    resampled = PriceSeries.from_points(points).resample(30)
+
+    assert len(resampled) == 2
+    assert resampled[0].price == (Decimal("0.10") + Decimal("1")) / Decimal(2)
+    assert str(resampled[1].price) == "0.8825"
+    assert resampled.end == points[3].end
+
+
+def test_price_series_stops_at_first_gap() -> None:
+    points = _points("0.1", "0.2", "0.3", "0.4")
+    del points[2]
+
+    series = PriceSeries.from_points(points)
+
+    assert list(series) == points[:2]
+
+
+def test_price_series_since_cuts_at_aligned_boundary() -> None:
+    points = _points("0.1", "0.2", "0.3", "0.4", "0.5", "0.6")
+    series = PriceSeries.from_points(points)
+    cut = int(points[2].start.timestamp()) + 60
+
+    assert series.since(cut) == points[3:]
+    assert series.since(cut, align_minutes=30) == points[4:]
+    assert series.since(int(points[0].start.timestamp())) is series
+
+
+def test_price_series_snapshot_round_trips_view() -> None:
+    points = _points("0.10", "1", "-0.235", "2.0")
+    view = PriceSeries.from_points(points).resample(30)[1:]
+
+    restored = PriceSeries.from_snapshot(view.to_snapshot(), timezone.utc)
+
+    assert restored == view
+    assert restored.values is not view.values
+    assert list(restored) == list(view)
+
+
+def test_schedule_solution_same_schedule_ignores_generation_time() -> None:
+    points = _points("0.1", "0.2", "0.3", "0.4")
+    series = PriceSeries.from_points(points)
+    placement = ScheduledActivity(
+        activity_id="wash",
+        start=points[1].start,
+        end=points[2].end,
+        slot_prices=series[1:3],
+        cost=Decimal("0.075"),
+    )
+    plan = ScheduleSolution(
+        generated_at=points[0].start,
+        horizon_start=points[0].start,
+        horizon_end=points[-1].end,
+        activities=[placement],
+        total_cost=Decimal("0.075"),
+        average_price=Decimal("0.15"),
+        unscheduled_activity_ids=["dry", "oven"],
+    )
+
+    regenerated = replace(
+        plan,
+        generated_at=points[1].start,
+        horizon_start=points[1].start,
+        activities=[replace(placement, slot_prices=list(series[1:3]))],
+        unscheduled_activity_ids=["oven", "dry"],
+    )
+    moved = replace(
+        plan, activities=[replace(placement, start=points[2].start, end=points[3].end)]
+    )
+
+    assert plan.same_schedule(regenerated)
+    assert not plan.same_schedule(moved)
+    assert not plan.same_schedule(replace(plan, unscheduled_activity_ids=["dry"]))
@@ -200,7 +200,7 @@ async def test_options_flow_edit_activity_with_real_coordinator(hass) -> None:
     set_coordinator(runtime, coordinator)
     hass.data[DOMAIN][entry.entry_id] = runtime
 
-    await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_refresh()
 
     flow = EnergyAdvisorOptionsFlowHandler(entry)
     flow.hass = hass
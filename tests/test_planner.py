@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, time, timezone, timedelta
 from decimal import Decimal
 
 import pytest
 
-from custom_components.energy_advisor.models import ActivityDefinition, EnergyAdvisorConfig, PricePoint
-from custom_components.energy_advisor.planner import PlannerInputs, PlanningError, generate_plan
+from custom_components.energy_advisor import planner
+from custom_components.energy_advisor.const import (
+    PLANNER_BACKEND_NUMPY,
+    PLANNER_SOLVER_GREEDY,
+    PLANNER_SOLVER_OPTIMAL,
+)
+from custom_components.energy_advisor.models import (
+    ActivityDefinition,
+    EnergyAdvisorConfig,
+    PricePoint,
+    PriceSeries,
+)
+from custom_components.energy_advisor.planner import (
+    COST_ENGINE_PREFIX_SUM,
+    COST_ENGINE_SCAN,
+    PlanMemo,
+    PlannerInputs,
+    PlanningError,
+    generate_plan,
+)
 
 
 def _price_point(start_hour: int, start_minute: int, price: float) -> PricePoint:
@@ -65,6 +84,34 @@ def test_generate_plan_aggregates_prices() -> None:
     assert plan.activities[0].cost == Decimal("0.10")
 
 
+def test_scheduled_slot_prices_are_series_views() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    prices = [
+        _price_point(0, minute, 0.1 * (4 - index))
+        for index, minute in enumerate((0, 15, 30, 45))
+    ]
+    activities = [ActivityDefinition(id="wash", name="Washing", duration_minutes=30)]
+
+    plan = generate_plan(PlannerInputs(config=config, activities=activities, prices=prices))
+
+    placement = plan.activities[0]
+    assert isinstance(placement.slot_prices, PriceSeries)
+    assert placement.slot_prices == prices[2:]
+    assert placement.slot_price_dicts() is placement.slot_price_dicts()
+    assert placement.slot_price_dicts()[0] == {
+        "start": prices[2].start.isoformat(),
+        "end": prices[2].end.isoformat(),
+        "price": str(prices[2].price),
+        "currency": "SEK",
+    }
+
+
 def test_generate_plan_rejects_invalid_slot_multiple() -> None:
     config = EnergyAdvisorConfig(
         price_sensor="sensor.nordpool",
@@ -77,3 +124,427 @@ def test_generate_plan_rejects_invalid_slot_multiple() -> None:
 
     with pytest.raises(PlanningError):
         generate_plan(PlannerInputs(config=config, activities=[], prices=prices))
+
+
+def test_prefix_sum_engine_matches_scan_engine() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    raw = [0.31, 0.12, 0.47, 0.05, 0.05, 0.22, 0.18, 0.61, 0.09, 0.14, 0.33, 0.02]
+    prices = []
+    for hour in range(8):
+        for quarter in range(4):
+            value = raw[(hour * 4 + quarter * 7) % len(raw)]
+            prices.append(_price_point(hour, quarter * 15, value))
+    activities = [
+        ActivityDefinition(id="ev", name="EV", duration_minutes=180),
+        ActivityDefinition(id="wash", name="Washing", duration_minutes=50, priority=1),
+        ActivityDefinition(
+            id="dish", name="Dishwasher", duration_minutes=95, latest_end=time(5, 0)
+        ),
+        ActivityDefinition(id="dry", name="Dryer", duration_minutes=20, earliest_start=time(2, 0)),
+    ]
+
+    fast = generate_plan(
+        PlannerInputs(config, activities, prices, cost_engine=COST_ENGINE_PREFIX_SUM)
+    )
+    reference = generate_plan(
+        PlannerInputs(config, activities, prices, cost_engine=COST_ENGINE_SCAN)
+    )
+
+    assert [(a.activity_id, a.start, a.end, a.cost) for a in fast.activities] == [
+        (a.activity_id, a.start, a.end, a.cost) for a in reference.activities
+    ]
+    assert fast.total_cost == reference.total_cost
+    assert fast.unscheduled_activity_ids == reference.unscheduled_activity_ids
+
+
+def test_fixed_point_costs_match_decimal_reference() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=45,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    raw = ["0.1", "0.125", "1.0625", "0.3", "0.07", "2", "0.0001", "0.45", "0.333"]
+    prices = [
+        _price_point(index // 4, (index % 4) * 15, float(raw[index % len(raw)]))
+        for index in range(36)
+    ]
+    activities = [
+        ActivityDefinition(id="heat", name="Heater", duration_minutes=100),
+        ActivityDefinition(id="wash", name="Washing", duration_minutes=40),
+    ]
+
+    fast = generate_plan(PlannerInputs(config, activities, prices))
+    reference = generate_plan(
+        PlannerInputs(config, activities, prices, cost_engine=COST_ENGINE_SCAN)
+    )
+
+    assert [str(a.cost) for a in fast.activities] == [str(a.cost) for a in reference.activities]
+    assert [a.start for a in fast.activities] == [a.start for a in reference.activities]
+    assert str(fast.total_cost) == str(reference.total_cost)
+    assert str(fast.average_price) == str(reference.average_price)
+
+
+def test_occupancy_index_tracks_free_runs() -> None:
+    occupancy = planner._OccupancyIndex(8)
+
+    occupancy.occupy(2, 2)
+    occupancy.occupy(4, 1)
+
+    assert list(occupancy.runs) == [2, 1, -3, -2, -1, 3, 2, 1]
+    assert list(occupancy.free_starts(2)) == [0, 5, 6]
+    assert not occupancy.is_free(1, 2)
+
+    occupancy.release(2, 2)
+
+    assert list(occupancy.runs) == [4, 3, 2, 1, -1, 3, 2, 1]
+    assert list(occupancy.free_starts(3)) == [0, 1, 5]
+
+
+def test_feasible_starts_are_shared_per_daily_window() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    prices = [
+        PricePoint(
+            start=base + timedelta(hours=hour),
+            end=base + timedelta(hours=hour + 1),
+            price=Decimal("0.1"),
+            currency="SEK",
+        )
+        for hour in range(48)
+    ]
+    grid = planner._SlotGrid.build(PriceSeries.from_points(prices), timezone.utc)
+    evening = ActivityDefinition(id="a", name="A", duration_minutes=120, earliest_start=time(20, 0))
+    other_evening = ActivityDefinition(
+        id="b", name="B", duration_minutes=120, earliest_start=time(20, 0)
+    )
+
+    ranges = grid.feasible_starts(evening, config, 120)
+
+    assert ranges == [range(20, 22), range(44, 46)]
+    assert grid.feasible_starts(other_evening, config, 120) is ranges
+
+
+def _utc_hourly_prices(base: datetime, prices: list[float]) -> list[PricePoint]:
+    return [
+        PricePoint(
+            start=base + timedelta(hours=hour),
+            end=base + timedelta(hours=hour + 1),
+            price=Decimal(str(price)),
+            currency="SEK",
+        )
+        for hour, price in enumerate(prices)
+    ]
+
+
+def test_overnight_window_wraps_past_midnight() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(22, 0),
+        window_end=time(6, 0),
+        timezone="UTC",
+    )
+    hourly = [0.5] * 48
+    hourly[12] = 0.01  # midday, outside the window
+    hourly[23] = hourly[24] = 0.1  # 23:00-01:00 across midnight
+    prices = _utc_hourly_prices(datetime(2025, 1, 1, tzinfo=timezone.utc), hourly)
+    activities = [ActivityDefinition(id="charge", name="Charge", duration_minutes=120)]
+
+    plan = generate_plan(PlannerInputs(config=config, activities=activities, prices=prices))
+
+    assert plan.activities[0].start == datetime(2025, 1, 1, 23, 0, tzinfo=timezone.utc)
+    assert plan.activities[0].end == datetime(2025, 1, 2, 1, 0, tzinfo=timezone.utc)
+
+
+def test_windows_use_configured_time_zone() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(6, 0),
+        window_end=time(8, 0),
+        timezone="Europe/Stockholm",
+    )
+    hourly = [0.5] * 24
+    hourly[4] = 0.01  # 05:00 local, before the window
+    hourly[6] = 0.2  # 07:00 local
+    prices = _utc_hourly_prices(datetime(2025, 1, 1, tzinfo=timezone.utc), hourly)
+    activities = [ActivityDefinition(id="wash", name="Washing", duration_minutes=60)]
+
+    plan = generate_plan(PlannerInputs(config=config, activities=activities, prices=prices))
+
+    start = plan.activities[0].start
+    assert start == datetime(2025, 1, 1, 6, 0, tzinfo=timezone.utc)
+    assert start.utcoffset() == timedelta(hours=1)
+    assert plan.horizon_start.utcoffset() == timedelta(hours=1)
+
+
+def test_windows_follow_daylight_saving_changes() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(1, 0),
+        window_end=time(4, 0),
+        timezone="Europe/Stockholm",
+    )
+    # 2025-03-30 00:00 UTC is 01:00 CET; clocks jump from 02:00 to 03:00 local.
+    prices = _utc_hourly_prices(datetime(2025, 3, 30, tzinfo=timezone.utc), [0.5, 0.1, 0.1, 0.5])
+    activities = [ActivityDefinition(id="dish", name="Dishwasher", duration_minutes=120)]
+
+    plan = generate_plan(PlannerInputs(config=config, activities=activities, prices=prices))
+
+    # Only two real hours separate 01:00 and 04:00 local time on this day.
+    placement = plan.activities[0]
+    assert placement.start == datetime(2025, 3, 30, 0, 0, tzinfo=timezone.utc)
+    assert placement.end == datetime(2025, 3, 30, 2, 0, tzinfo=timezone.utc)
+    assert placement.end.utcoffset() == timedelta(hours=2)
+
+
+def _backend_fixture() -> tuple[EnergyAdvisorConfig, list[PricePoint], list[ActivityDefinition]]:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=15,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    raw = [0.42, 0.18, 0.07, 0.33, 0.11, 0.29, 0.05, 0.51]
+    prices = [
+        _price_point(index // 4, (index % 4) * 15, raw[(index * 3) % len(raw)])
+        for index in range(48)
+    ]
+    activities = [
+        ActivityDefinition(id="ev", name="EV", duration_minutes=240),
+        ActivityDefinition(
+            id="wash", name="Washing", duration_minutes=70, earliest_start=time(3, 0)
+        ),
+        ActivityDefinition(
+            id="dish", name="Dishwasher", duration_minutes=45, latest_end=time(6, 0)
+        ),
+    ]
+    return config, prices, activities
+
+
+def test_numpy_backend_matches_python_backend() -> None:
+    pytest.importorskip("numpy")
+    config, prices, activities = _backend_fixture()
+
+    python_plan = generate_plan(PlannerInputs(config, activities, prices))
+    numpy_plan = generate_plan(
+        PlannerInputs(replace(config, planner_backend=PLANNER_BACKEND_NUMPY), activities, prices)
+    )
+
+    assert [(a.activity_id, a.start, a.cost) for a in numpy_plan.activities] == [
+        (a.activity_id, a.start, a.cost) for a in python_plan.activities
+    ]
+    assert numpy_plan.unscheduled_activity_ids == python_plan.unscheduled_activity_ids
+
+
+def test_numpy_backend_falls_back_without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(planner, "np", None)
+    config, prices, activities = _backend_fixture()
+
+    plan = generate_plan(
+        PlannerInputs(replace(config, planner_backend=PLANNER_BACKEND_NUMPY), activities, prices)
+    )
+    expected = generate_plan(PlannerInputs(config, activities, prices))
+
+    assert [(a.activity_id, a.start) for a in plan.activities] == [
+        (a.activity_id, a.start) for a in expected.activities
+    ]
+
+
+def _hourly_point(hour: int, price: float) -> PricePoint:
+    start = datetime(2025, 1, 1, hour, 0, tzinfo=timezone.utc)
+    return PricePoint(
+        start=start, end=start + timedelta(hours=1), price=Decimal(str(price)), currency="SEK"
+    )
+
+
+def _packing_inputs(solver: str, budget: float = 2.0) -> PlannerInputs:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+        planner_solver=solver,
+        solver_time_budget=budget,
+    )
+    prices = [
+        _hourly_point(0, 0.30),
+        _hourly_point(1, 0.10),
+        _hourly_point(2, 0.30),
+        _hourly_point(3, 0.30),
+    ]
+    activities = [
+        ActivityDefinition(id="short", name="Short", duration_minutes=60),
+        ActivityDefinition(id="long", name="Long", duration_minutes=180, priority=1),
+    ]
+    return PlannerInputs(config=config, activities=activities, prices=prices)
+
+
+def test_optimal_solver_packs_activities_greedy_cannot() -> None:
+    greedy = generate_plan(_packing_inputs(PLANNER_SOLVER_GREEDY))
+    optimal = generate_plan(_packing_inputs(PLANNER_SOLVER_OPTIMAL))
+
+    assert greedy.unscheduled_activity_ids == ["long"]
+    assert optimal.unscheduled_activity_ids == []
+    placements = {activity.activity_id: activity.start.hour for activity in optimal.activities}
+    assert placements == {"short": 0, "long": 1}
+    assert optimal.total_cost == Decimal("1.00")
+
+
+def test_optimal_solver_falls_back_to_greedy_when_budget_exhausted(monkeypatch) -> None:
+    class _Clock:
+        now = 0.0
+
+        def monotonic(self) -> float:
+            self.now += 10.0
+            return self.now
+
+    monkeypatch.setattr(planner, "time_module", _Clock())
+
+    plan = generate_plan(_packing_inputs(PLANNER_SOLVER_OPTIMAL, budget=1.0))
+
+    assert plan.unscheduled_activity_ids == ["long"]
+    assert plan.activities[0].start.hour == 1
+
+
+def test_plan_memo_reuses_plan_for_identical_inputs() -> None:
+    config, prices, activities = _backend_fixture()
+    memo = PlanMemo()
+
+    first = memo.generate(PlannerInputs(config, list(activities), list(prices)))
+    second = memo.generate(PlannerInputs(config, list(activities), list(prices)))
+
+    assert second.activities is first.activities
+    assert memo.stats == {"hits": 1, "misses": 1, "extended": 0}
+
+    cheaper = [replace(prices[0], price=Decimal("0.01")), *prices[1:]]
+    third = memo.generate(PlannerInputs(config, list(activities), cheaper))
+
+    assert third.activities is not first.activities
+    assert memo.stats == {"hits": 1, "misses": 2, "extended": 0}
+
+    memo.generate(PlannerInputs(config, list(activities), cheaper, cost_engine=COST_ENGINE_SCAN))
+    assert memo.stats == {"hits": 1, "misses": 3, "extended": 0}
+
+
+def test_plan_memo_extends_plan_when_prices_are_appended() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+        incremental_planning=True,
+    )
+    hourly = [0.5] * 48
+    hourly[7] = 0.2  # today, inside the morning window
+    hourly[14] = 0.3  # today
+    hourly[31] = 0.2  # tomorrow morning, as cheap as today but not cheaper
+    hourly[36] = 0.1  # tomorrow at noon
+    series = PriceSeries.from_points(
+        _utc_hourly_prices(datetime(2025, 1, 1, tzinfo=timezone.utc), hourly)
+    )
+    activities = [
+        ActivityDefinition(
+            id="morning",
+            name="Morning",
+            duration_minutes=60,
+            earliest_start=time(6, 0),
+            latest_end=time(9, 0),
+        ),
+        ActivityDefinition(id="any", name="Any", duration_minutes=60, priority=1),
+    ]
+    memo = PlanMemo()
+
+    today = memo.generate(PlannerInputs(config, activities, series[:24]))
+    extended = memo.generate(PlannerInputs(config, activities, series))
+
+    assert memo.stats == {"hits": 0, "misses": 2, "extended": 1}
+    # Tomorrow's morning window is only as cheap, so the placement is kept as it is.
+    assert extended.activities[0] is today.activities[0]
+    assert today.activities[1].start == datetime(2025, 1, 1, 14, 0, tzinfo=timezone.utc)
+    assert extended.activities[1].start == datetime(2025, 1, 2, 12, 0, tzinfo=timezone.utc)
+    assert extended.horizon_end == datetime(2025, 1, 3, 0, 0, tzinfo=timezone.utc)
+
+
+def test_plan_extension_keeps_placements_outside_new_slots() -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+        incremental_planning=True,
+    )
+    hourly = [0.3, 0.1, 0.2] + [0.05] * 12
+    series = PriceSeries.from_points(
+        _utc_hourly_prices(datetime(2025, 1, 1, 12, tzinfo=timezone.utc), hourly)
+    )
+    # Appended slots start at midnight; the 12:00-15:00 window of tomorrow is not covered.
+    activities = [
+        ActivityDefinition(
+            id="afternoon",
+            name="Afternoon",
+            duration_minutes=60,
+            earliest_start=time(12, 0),
+            latest_end=time(15, 0),
+        ),
+    ]
+    memo = PlanMemo()
+
+    first = memo.generate(PlannerInputs(config, activities, series[:12]))
+    second = memo.generate(PlannerInputs(config, activities, series))
+
+    assert memo.stats["extended"] == 1
+    assert second.activities[0] is first.activities[0]
+    assert second.activities[0].start == datetime(2025, 1, 1, 13, 0, tzinfo=timezone.utc)
+
+
+def test_plan_extension_scans_only_appended_slots(monkeypatch) -> None:
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+        incremental_planning=True,
+    )
+    hourly = [0.5] * 24 + [0.4] * 24
+    hourly[30] = 0.1
+    series = PriceSeries.from_points(
+        _utc_hourly_prices(datetime(2025, 1, 1, tzinfo=timezone.utc), hourly)
+    )
+    activities = [ActivityDefinition(id="any", name="Any", duration_minutes=60)]
+    memo = PlanMemo()
+    memo.generate(PlannerInputs(config, activities, series[:24]))
+
+    costed: list[int] = []
+    calculate_cost = planner._calculate_cost
+
+    def _counting(candidate, required_minutes, slot_minutes):
+        costed.append(candidate.start_ts)
+        return calculate_cost(candidate, required_minutes, slot_minutes)
+
+    monkeypatch.setattr(planner, "_calculate_cost", _counting)
+    extended = memo.generate(PlannerInputs(config, activities, series))
+
+    assert memo.stats["extended"] == 1
+    assert extended.activities[0].start == datetime(2025, 1, 2, 6, 0, tzinfo=timezone.utc)
+    assert min(costed) >= series.start_ts + 24 * 3600
@@ -6,7 +6,12 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
-from custom_components.energy_advisor.price import PriceExtractionError, extract_price_points
+from custom_components.energy_advisor.price import (
+    PriceExtractionError,
+    extract_price_points,
+    get_price_cache,
+    price_fingerprint,
+)
 
 
 def _build_raw(start: datetime, price: float) -> dict[str, str | float]:
@@ -41,3 +46,47 @@ async def test_extract_price_points_without_raw(hass) -> None:
 
     with pytest.raises(PriceExtractionError):
         extract_price_points(hass, "sensor.nordpool")
+
+
+async def test_price_fingerprint_ignores_state_value(hass) -> None:
+    now = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    raw = [_build_raw(now, 0.10), _build_raw(now + timedelta(minutes=15), 0.20)]
+
+    hass.states.async_set("sensor.nordpool", "0.10", {"currency": "SEK", "raw_today": raw})
+    first = price_fingerprint(hass.states.get("sensor.nordpool"))
+    hass.states.async_set("sensor.nordpool", "0.20", {"currency": "SEK", "raw_today": raw})
+    second = price_fingerprint(hass.states.get("sensor.nordpool"))
+    hass.states.async_set(
+        "sensor.nordpool",
+        "0.20",
+        {
+            "currency": "SEK",
+            "raw_today": raw,
+            "raw_tomorrow": [_build_raw(now + timedelta(days=1), 0.3)],
+        },
+    )
+    third = price_fingerprint(hass.states.get("sensor.nordpool"))
+
+    assert first is not None
+    assert first == second
+    assert third != second
+
+
+async def test_extract_price_points_uses_state_cache(hass) -> None:
+    now = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    hass.states.async_set(
+        "sensor.nordpool", "0.10", {"currency": "SEK", "raw_today": [_build_raw(now, 0.10)]}
+    )
+
+    first = extract_price_points(hass, "sensor.nordpool")
+    second = extract_price_points(hass, "sensor.nordpool")
+    assert second is first
+
+    hass.states.async_set(
+        "sensor.nordpool", "0.20", {"currency": "SEK", "raw_today": [_build_raw(now, 0.20)]}
+    )
+    third = extract_price_points(hass, "sensor.nordpool")
+
+    assert third is not first
+    assert float(third[0].price) == pytest.approx(0.20)
+    assert get_price_cache(hass).stats == {"hits": 1, "misses": 2, "size": 1}
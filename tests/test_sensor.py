@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from decimal import Decimal
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.energy_advisor.const import DOMAIN
-from custom_components.energy_advisor.sensor import EnergyAdvisorPlanSensor
+from custom_components.energy_advisor.sensor import (
+    EnergyAdvisorActivitySensor,
+    EnergyAdvisorPlanSensor,
+)
 from custom_components.energy_advisor.models import (
+    ActivityDefinition,
     PricePoint,
     ScheduleSolution,
     ScheduledActivity,
@@ -21,7 +26,7 @@ class DummyCoordinator:
         self.data = data
         self._activity_names = {"wash": "Washer"}
 
-    def async_add_listener(self, update_callback):
+    def async_add_listener(self, update_callback, context=None):
         return lambda: None
 
     def async_request_refresh(self):
@@ -30,6 +35,15 @@ class DummyCoordinator:
     def get_activity_name(self, activity_id: str):
         return self._activity_names.get(activity_id)
 
+    last_update_success = True
+
+    def get_placement(self, activity_id: str):
+        if self.data is None:
+            return None
+        return next(
+            (item for item in self.data.activities if item.activity_id == activity_id), None
+        )
+
 
 async def test_plan_sensor_exposes_attributes(hass) -> None:
     entry = MockConfigEntry(domain=DOMAIN, data={})
@@ -69,3 +83,62 @@ async def test_plan_sensor_exposes_attributes(hass) -> None:
     assert attributes["activities"][0]["activity_id"] == "wash"
     assert attributes["activities"][0]["name"] == "Washer"
     assert attributes["total_cost"] == str(plan.total_cost)
+    assert attributes["scheduled"] == ["wash"]
+    assert sensor.extra_state_attributes is attributes
+    assert "activities" in sensor._unrecorded_attributes
+
+    coordinator.data = replace(plan, activities=[])
+    assert sensor.extra_state_attributes["activities"] == []
+
+
+async def test_activity_sensor_writes_only_when_its_placement_changes(hass) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    wash = ScheduledActivity(
+        activity_id="wash",
+        start=start,
+        end=start.replace(hour=1),
+        slot_prices=[],
+        cost=Decimal("0.1"),
+    )
+    dry = ScheduledActivity(
+        activity_id="dry",
+        start=start.replace(hour=1),
+        end=start.replace(hour=2),
+        slot_prices=[],
+        cost=Decimal("0.2"),
+    )
+    plan = ScheduleSolution(
+        generated_at=start,
+        horizon_start=start,
+        horizon_end=start.replace(hour=2),
+        activities=[wash, dry],
+        total_cost=Decimal("0.3"),
+        average_price=Decimal("0.15"),
+    )
+    coordinator = DummyCoordinator(hass, plan)
+    sensor = EnergyAdvisorActivitySensor(
+        coordinator, entry, ActivityDefinition(id="wash", name="Washer", duration_minutes=60)
+    )
+    sensor.hass = hass
+    await sensor.async_added_to_hass()
+    writes = []
+    sensor.async_write_ha_state = lambda: writes.append(sensor.native_value)
+
+    assert sensor.native_value == start
+    assert sensor.extra_state_attributes["cost"] == "0.1"
+
+    coordinator.data = replace(plan, activities=[wash, replace(dry, cost=Decimal("0.3"))])
+    sensor._handle_coordinator_update()
+    coordinator.data = replace(plan, activities=[wash, dry])
+    sensor._handle_coordinator_update()
+    assert writes == []
+
+    moved = start.replace(hour=1)
+    coordinator.data = replace(
+        plan, activities=[replace(wash, start=moved, end=start.replace(hour=2))]
+    )
+    sensor._handle_coordinator_update()
+    assert writes == [moved]
@@ -0,0 +1,120 @@
+"""Tests for Energy Advisor persistence helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from custom_components.energy_advisor.models import (
+    ActivityDefinition,
+    EnergyAdvisorConfig,
+    PricePoint,
+    PriceSeries,
+    ScheduledActivity,
+    ScheduleSolution,
+)
+from custom_components.energy_advisor.planner import PlannerInputs, generate_plan
+from custom_components.energy_advisor.storage import EnergyAdvisorStorageState
+
+
+def _series(zone=timezone.utc) -> PriceSeries:
+    start = datetime(2025, 1, 1, tzinfo=zone)
+    return PriceSeries.from_points(
+        PricePoint(
+            start=start + timedelta(hours=index),
+            end=start + timedelta(hours=index + 1),
+            price=Decimal(price),
+            currency="SEK",
+        )
+        for index, price in enumerate(["0.30", "0.1", "0.25", "0.4"])
+    )
+
+
+def test_storage_state_round_trips_plan_and_prices() -> None:
+    series = _series()
+    placement = ScheduledActivity(
+        activity_id="wash",
+        start=series.start_at(1),
+        end=series.start_at(3),
+        slot_prices=series[1:3],
+        cost=Decimal("0.35"),
+    )
+    plan = ScheduleSolution(
+        generated_at=series.start,
+        horizon_start=series.start,
+        horizon_end=series.end,
+        activities=[placement],
+        total_cost=Decimal("0.35"),
+        average_price=Decimal("0.175"),
+        unscheduled_activity_ids=["dry"],
+    )
+    state = EnergyAdvisorStorageState.from_definitions(
+        [ActivityDefinition(id="wash", name="Washing", duration_minutes=120)]
+    )
+    state.plan = plan
+    state.prices = series
+
+    data = state.as_dict()
+    assert data["plan"]["activities"][0]["slots"] == [1, 2, 60]
+
+    restored = EnergyAdvisorStorageState.from_dict(data)
+
+    assert restored.prices == series
+    assert restored.plan == plan
+    assert restored.plan.activities[0].slot_price_dicts() == placement.slot_price_dicts()
+    assert restored.to_definitions()[0].id == "wash"
+
+
+def test_storage_state_drops_unreadable_plan() -> None:
+    data = EnergyAdvisorStorageState().as_dict()
+    data["plan"] = {"generated_at": "not a date"}
+
+    restored = EnergyAdvisorStorageState.from_dict(data)
+
+    assert restored.plan is None
+    assert restored.prices is None
+
+
+def test_storage_state_keeps_fixed_offset_zone() -> None:
+    zone = timezone(timedelta(hours=2))
+    state = EnergyAdvisorStorageState(prices=_series(zone))
+
+    restored = EnergyAdvisorStorageState.from_dict(state.as_dict())
+
+    assert restored.prices.tzinfo == zone
+    assert restored.prices.start == datetime(2025, 1, 1, tzinfo=zone)
+    assert restored.prices.start.utcoffset() == timedelta(hours=2)
+
+
+def test_storage_state_restores_slots_coarser_than_raw_prices() -> None:
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    raw = PriceSeries.from_points(
+        PricePoint(
+            start=start + timedelta(minutes=15 * index),
+            end=start + timedelta(minutes=15 * (index + 1)),
+            price=Decimal(price),
+            currency="SEK",
+        )
+        for index, price in enumerate(
+            ["0.4", "0.4", "0.4", "0.4", "0.1", "0.2", "0.1", "0.3", "0.2", "0.1", "0.3", "0.1"]
+        )
+    )
+    config = EnergyAdvisorConfig(
+        price_sensor="sensor.nordpool",
+        slot_minutes=60,
+        window_start=time(0, 0),
+        window_end=time(23, 59),
+        timezone="UTC",
+    )
+    activities = [ActivityDefinition(id="wash", name="Washing", duration_minutes=120)]
+    plan = generate_plan(PlannerInputs(config, activities, raw))
+    state = EnergyAdvisorStorageState.from_definitions(activities)
+    state.plan = plan
+    state.prices = raw
+
+    restored = EnergyAdvisorStorageState.from_dict(state.as_dict())
+
+    placement = plan.activities[0]
+    restored_placement = restored.plan.activities[0]
+    assert len(placement.slot_prices) == 2
+    assert restored_placement.slot_price_dicts() == placement.slot_price_dicts()